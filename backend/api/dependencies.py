@@ -7,6 +7,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from django.contrib.auth import get_user_model
 from asgiref.sync import sync_to_async
 
+from apps.users.blacklist import ais_token_revoked
 from core.security import decode_token
 
 User = get_user_model()
@@ -14,6 +15,9 @@ User = get_user_model()
 # Security scheme for JWT tokens
 security = HTTPBearer()
 
+# JSON columns no request handler reads; skipped when loading the caller
+AUTH_DEFERRED_FIELDS = ('metadata', 'notification_preferences')
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -58,10 +62,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Check if token is blacklisted (wrap Django ORM in sync_to_async)
-    from apps.users.models import TokenBlacklist
-    is_blacklisted = await sync_to_async(TokenBlacklist.objects.filter(token=token).exists)()
-    if is_blacklisted:
+    # Check if token is revoked (shared cache, or the blacklist table without one)
+    if await ais_token_revoked(token, payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
@@ -70,7 +72,7 @@ async def get_current_user(
     
     # Get user from database (wrap Django ORM in sync_to_async)
     try:
-        user = await sync_to_async(User.objects.get)(id=user_id)
+        user = await sync_to_async(User.objects.defer(*AUTH_DEFERRED_FIELDS).get)(id=user_id)
     except User.DoesNotExist:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
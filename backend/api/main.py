@@ -3,9 +3,16 @@ FastAPI Main Application
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import json
 import os
 import django
 from decouple import config
@@ -31,13 +38,19 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("🛑 FastAPI application shutting down...")
 
+OPENAPI_URL = "/openapi.json"
+SWAGGER_OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+
 # Create FastAPI application
+# OpenAPI/docs routes are registered below so the schema can be served
+# from a cached, pre-serialized document.
 app = FastAPI(
     title="CPPay API",
     description="Crypto Payment Platform - High-performance API",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
     lifespan=lifespan,
 )
 
@@ -81,6 +94,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    # FastAPI routes never fire Django's request signals, so persistent
+    # connections are only checked here: drop the shared sync thread's
+    # connection if the failure left it broken or past CONN_MAX_AGE
+    from asgiref.sync import sync_to_async
+    from django.db import close_old_connections
+    await sync_to_async(close_old_connections)()
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -147,6 +166,41 @@ app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
 app.include_router(bundler.router, prefix="/api/v1", tags=["Bundler"])
 
+
+# OpenAPI schema and docs
+@lru_cache(maxsize=1)
+def get_openapi_document() -> bytes:
+    """Build and serialize the OpenAPI schema once per process"""
+    return json.dumps(app.openapi()).encode("utf-8")
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi_json():
+    """Serve the cached OpenAPI document"""
+    return Response(content=get_openapi_document(), media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    """Swagger UI"""
+    return get_swagger_ui_html(
+        openapi_url=OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=SWAGGER_OAUTH2_REDIRECT_URL,
+    )
+
+
+@app.get(SWAGGER_OAUTH2_REDIRECT_URL, include_in_schema=False)
+async def swagger_ui_redirect():
+    """Swagger UI OAuth2 redirect"""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc():
+    """ReDoc"""
+    return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc")
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -2,7 +2,12 @@
 Authentication routes - Registration, Login, Token Management
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from functools import wraps
+
 from django.contrib.auth import get_user_model
+from django.db import close_old_connections
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
@@ -18,7 +23,8 @@ from api.schemas.user import (
     PasswordChange,
     MessageResponse
 )
-from api.dependencies import get_current_user, get_current_active_user
+from api.dependencies import get_current_user, get_current_active_user, security
+from apps.users.blacklist import ais_token_revoked, revoke_token
 from apps.users.services import UserService
 from core.security import (
     create_access_token,
@@ -27,7 +33,27 @@ from core.security import (
 )
 
 User = get_user_model()
-router = APIRouter()
+# Every endpoint here declares a response_model, so orjson sees only JSON-safe types
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _in_pool(func):
+    """
+    Run func in the thread pool rather than the shared sync thread
+    
+    Each pool thread keeps its own persistent database connection, and
+    Django's request signals never fire for FastAPI, so stale or broken
+    connections are closed here before and after the ORM work.
+    """
+    @wraps(func)
+    def run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    
+    return sync_to_async(run, thread_sensitive=False)
 
 
 @router.post("/register", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
@@ -40,8 +66,9 @@ async def register(user_data: UserRegister):
     - Optionally accepts phone number and referral code
     """
     try:
-        # Wrap synchronous Django ORM calls in sync_to_async
-        user, verification_token = await sync_to_async(UserService.create_user)(
+        # Run in the thread pool (not the shared sync thread) so concurrent
+        # signups hash passwords in parallel; argon2 releases the GIL
+        user, verification_token = await _in_pool(UserService.create_user)(
             email=user_data.email,
             password=user_data.password,
             phone_number=user_data.phone_number,
@@ -67,13 +94,14 @@ async def login(credentials: UserLogin):
     - Returns access token (30 min expiry) and refresh token (7 days)
     - Updates last login timestamp
     """
-    # Wrap synchronous Django ORM calls in sync_to_async
-    user = await sync_to_async(UserService.authenticate_user)(
+    # Thread pool, not the shared sync thread: logins must not queue behind
+    # each other's password hashes
+    user_id = await _in_pool(UserService.authenticate_credentials)(
         email=credentials.email,
         password=credentials.password
     )
     
-    if not user:
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -81,8 +109,8 @@ async def login(credentials: UserLogin):
         )
     
     # Create tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": str(user_id)})
+    refresh_token = create_refresh_token(data={"sub": str(user_id)})
     
     return {
         "access_token": access_token,
@@ -117,13 +145,8 @@ async def refresh_token(token_data: TokenRefresh):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Check if token is blacklisted - wrap ORM call
-    def _check_refresh(token):
-        from apps.users.models import TokenBlacklist
-        return TokenBlacklist.objects.filter(token=token).exists()
-    
-    is_blacklisted = await sync_to_async(_check_refresh, thread_sensitive=False)(token_data.refresh_token)
-    if is_blacklisted:
+    # Check if token is revoked (shared cache, or the blacklist table without one)
+    if await ais_token_revoked(token_data.refresh_token, payload):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token has been revoked",
@@ -138,7 +161,7 @@ async def refresh_token(token_data: TokenRefresh):
             return None
     
     user_id = payload.get("sub")
-    user = await sync_to_async(_get_user, thread_sensitive=False)(user_id)
+    user = await _in_pool(_get_user)(user_id)
     
     if not user:
         raise HTTPException(
@@ -159,13 +182,18 @@ async def refresh_token(token_data: TokenRefresh):
 
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
     """
-    Logout user (token should be discarded client-side)
+    Logout user
     
-    - In production, implement token blacklisting
-    - For now, client should discard the token
+    - Revokes the access token used for this request until it expires
+    - Client should discard its refresh token as well
     """
+    token = credentials.credentials
+    await _in_pool(revoke_token)(token, decode_token(token), reason="logout")
     return {"message": "Logged out successfully. Please discard your tokens."}
 
 
@@ -246,7 +274,7 @@ async def request_password_reset(reset_request: PasswordResetRequest):
     def _request_reset(email):
         return UserService.request_password_reset(email)
     
-    success, token = await sync_to_async(_request_reset, thread_sensitive=False)(reset_request.email)
+    success, token = await _in_pool(_request_reset)(reset_request.email)
     
     return {
         "message": f"If an account exists with this email, a password reset link has been sent. Token (dev): {token}"
@@ -265,7 +293,7 @@ async def reset_password(reset_data: PasswordResetConfirm):
     def _reset_pwd(token, password):
         return UserService.reset_password(token=token, new_password=password)
     
-    success, message = await sync_to_async(_reset_pwd, thread_sensitive=False)(
+    success, message = await _in_pool(_reset_pwd)(
         reset_data.token,
         reset_data.new_password
     )
@@ -294,7 +322,7 @@ async def change_password(
     def _change_pwd(user, current_pwd, new_pwd):
         return UserService.change_password(user=user, current_password=current_pwd, new_password=new_pwd)
     
-    success, message = await sync_to_async(_change_pwd, thread_sensitive=False)(
+    success, message = await _in_pool(_change_pwd)(
         current_user,
         password_data.current_password,
         password_data.new_password
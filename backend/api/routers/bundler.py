@@ -86,6 +86,7 @@ class JobSummary(BaseModel):
 class OperationDetail(OperationSummary):
     jobs: List[JobSummary]
     metadata: Dict[str, Any]
+    tx_hash: Optional[str]
     completed_at: Optional[str]
 
 
@@ -130,18 +131,21 @@ def _coerce_payload(payload: OperationPayload) -> Dict[str, Any]:
     return data
 
 
+def _operation_fields(operation: UserOperation) -> Dict[str, Any]:
+    return {
+        "id": operation.id,
+        "chain_id": operation.chain_id,
+        "sender": operation.sender,
+        "user_op_hash": operation.user_op_hash,
+        "status": operation.status,
+        "queued_at": operation.queued_at.isoformat(),
+        "last_updated": operation.updated_at.isoformat(),
+        "last_error": operation.failure_reason or None,
+    }
+
+
 def _serialize_operation(operation: UserOperation) -> OperationSummary:
-    last_error = operation.failure_reason or None
-    return OperationSummary(
-        id=operation.id,
-        chain_id=operation.chain_id,
-        sender=operation.sender,
-        user_op_hash=operation.user_op_hash,
-        status=operation.status,
-        queued_at=operation.queued_at.isoformat(),
-        last_updated=operation.updated_at.isoformat(),
-        last_error=last_error,
-    )
+    return OperationSummary(**_operation_fields(operation))
 
 
 async def _serialize_operation_detail(operation: UserOperation) -> OperationDetail:
@@ -158,11 +162,13 @@ async def _serialize_operation_detail(operation: UserOperation) -> OperationDeta
         )
         for job in jobs
     ]
-    base_summary = _serialize_operation(operation)
+    # Build the detail directly rather than validating a summary, dumping it
+    # back to a dict and validating it again.
     return OperationDetail(
-        **base_summary.model_dump(),
+        **_operation_fields(operation),
         jobs=job_summaries,
         metadata=operation.metadata,
+        tx_hash=operation.tx_hash,
         completed_at=operation.completed_at.isoformat() if operation.completed_at else None,
     )
 
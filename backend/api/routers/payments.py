@@ -22,12 +22,13 @@ from services.payments import (
 	DEXAggregationService,
 	PaystackService,
 	PriceOracleService,
+	get_paystack_service,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-paystack = PaystackService()
+paystack = get_paystack_service()
 price_oracle = PriceOracleService()
 dex_aggregator = DEXAggregationService()
 crypto_fiat_bridge = CryptoToFiatBridge()
@@ -38,7 +38,11 @@ async def list_transactions(
     
     # Get transactions (wrap Django ORM properly)
     def get_transactions():
-        return list(Transaction.objects.filter(user=current_user).order_by('-created_at')[:50])
+        return list(
+            Transaction.objects.filter(user=current_user)
+            .defer('metadata', 'input_data', 'error_message', 'failure_reason')
+            .order_by('-created_at')[:50]
+        )
     
     transactions = await sync_to_async(get_transactions)()
     
@@ -4,7 +4,7 @@ Simple Wallet Router - Django ORM based
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List, Optional
 from asgiref.sync import sync_to_async
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
 
 from api.dependencies import get_current_user
@@ -15,12 +15,21 @@ User = get_user_model()
 
 router = APIRouter()
 
+# 0x-prefixed 20-byte address; anything else is rejected with a 422
+ADDRESS_PATTERN = r'^0x[0-9a-fA-F]{40}$'
+
 
 class WalletCreate(BaseModel):
-    smart_account_address: str
-    owner_address: str  # This is eoa_address
+    smart_account_address: str = Field(..., pattern=ADDRESS_PATTERN)
+    owner_address: str = Field(..., pattern=ADDRESS_PATTERN)  # This is eoa_address
     wallet_type: str  # Ignored for now
     chain_id: int
+    
+    @field_validator('smart_account_address', 'owner_address')
+    @classmethod
+    def normalize_address(cls, v):
+        # Stored as bytes and read back lowercase; respond the same way
+        return v if v.islower() else v.lower()
 
 
 class WalletOut(BaseModel):
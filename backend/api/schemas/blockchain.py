@@ -2,7 +2,7 @@
 Pydantic schemas for blockchain operations
 Used by blockchain router for request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict
 from decimal import Decimal
 from datetime import datetime
@@ -26,6 +26,8 @@ class BalanceRequest(BaseModel):
 
 class BalanceResponse(BaseModel):
     """Response schema for balance queries"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     address: str
     chain: str
     native_balance: str
@@ -41,6 +43,8 @@ class GasSponsorshipCheckRequest(BaseModel):
 
 class GasSponsorshipCheckResponse(BaseModel):
     """Response schema for gas sponsorship eligibility"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     eligible: bool
     reason: Optional[str]
     remaining_daily_allowance: str
@@ -55,6 +59,8 @@ class SmartAccountPredictRequest(BaseModel):
 
 class SmartAccountPredictResponse(BaseModel):
     """Response schema for smart account prediction"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     predicted_address: str
     init_code: str
     factory_address: str
@@ -63,6 +69,8 @@ class SmartAccountPredictResponse(BaseModel):
 
 class SmartAccountInfoResponse(BaseModel):
     """Response schema for smart account info"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     address: str
     is_deployed: bool
     owner: str
@@ -81,6 +89,8 @@ class TransactionEstimateRequest(BaseModel):
 
 class TransactionEstimateResponse(BaseModel):
     """Response schema for transaction estimate"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     estimated_gas: int
     gas_price: str
     max_fee_per_gas: str
@@ -103,6 +113,8 @@ class TransactionSendRequest(BaseModel):
 
 class TransactionSendResponse(BaseModel):
     """Response schema for transaction send"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     transaction_id: int
     status: str
     message: str
@@ -112,6 +124,8 @@ class TransactionSendResponse(BaseModel):
 
 class TransactionStatusResponse(BaseModel):
     """Response schema for transaction status query"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     transaction_id: int
     status: str
     tx_hash: Optional[str]
@@ -124,6 +138,8 @@ class TransactionStatusResponse(BaseModel):
 
 class GasStatisticsResponse(BaseModel):
     """Response schema for user gas statistics"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     user_id: int
     total_sponsored: str
     used_today: str
@@ -2,7 +2,7 @@
 Wallet-related Pydantic schemas
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 from datetime import datetime
 from decimal import Decimal
@@ -22,7 +22,8 @@ class WalletRegisterRequest(BaseModel):
             raise ValueError('Address must start with 0x')
         if v and len(v) != 42:
             raise ValueError('Invalid Ethereum address length')
-        return v.lower()
+        # islower() is a single C pass; skip the copy for normalized input
+        return v if not v or v.islower() else v.lower()
 
 
 class WalletResponse(BaseModel):
@@ -38,12 +39,13 @@ class WalletResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class GasAllowanceResponse(BaseModel):
     """Gas allowance status from contract"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     remaining: Decimal = Field(..., description="Remaining gas in ETH")
     limit: Decimal = Field(..., description="Daily limit in ETH")
     used: Decimal = Field(..., description="Gas used today in ETH")
@@ -65,7 +67,7 @@ class VerifyUserRequest(BaseModel):
             raise ValueError('Address must start with 0x')
         if len(v) != 42:
             raise ValueError('Invalid Ethereum address length')
-        return v.lower()
+        return v if v.islower() else v.lower()
 
 
 class TransactionCreateRequest(BaseModel):
@@ -84,7 +86,7 @@ class TransactionCreateRequest(BaseModel):
     def validate_hex(cls, v):
         if not v.startswith('0x'):
             raise ValueError('Must start with 0x')
-        return v.lower()
+        return v if v.islower() else v.lower()
 
 
 class TransactionResponse(BaseModel):
@@ -101,10 +103,11 @@ class TransactionResponse(BaseModel):
     chain_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 class MessageResponse(BaseModel):
     """Generic message response"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
     message: str
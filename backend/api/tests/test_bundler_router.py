@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from api.main import app
 from api.dependencies import get_current_user
@@ -76,6 +78,8 @@ def test_queue_and_list_operations(auth_user):
     assert detail_response.status_code == 200
     detail = detail_response.json()
     assert detail["metadata"] == {"source": "test"}
+    assert detail["tx_hash"] is None
+    assert UserOperation.objects.get(id=operation_id).source == "test"
     assert detail["jobs"]
 
     events_response = client.get(f"/api/v1/bundler/operations/{operation_id}/events")
@@ -111,10 +115,34 @@ def test_dispatch_and_mark_included_flow(auth_user):
 
     operation = UserOperation.objects.get(id=operation_id)
     assert operation.status == UserOperation.Status.INCLUDED
-    assert operation.metadata.get("tx_hash")
+    assert operation.tx_hash == "0x" + "1" * 64
+    assert "tx_hash" not in operation.metadata
 
     job = BundlerJob.objects.get(id=job_id)
     assert job.status == BundlerJob.Status.SUCCEEDED
 
     events = client.get(f"/api/v1/bundler/operations/{operation_id}/events").json()
-    assert any(event["event_type"] == "included" for event in events)
\ No newline at end of file
+    assert any(event["event_type"] == "included" for event in events)
+
+@pytest.mark.django_db(transaction=True)
+def test_reconcile_requeues_stalled_jobs(auth_user):
+    """Stalled dispatches are re-queued and audited in one batch."""
+
+    queue_resp = client.post("/api/v1/bundler/operations", json=_queue_payload())
+    operation_id = queue_resp.json()["operation_id"]
+    job_id = queue_resp.json()["job_id"]
+
+    client.post("/api/v1/bundler/jobs/dispatch", params={"batch_size": 5})
+    BundlerJob.objects.filter(id=job_id).update(
+        last_attempt_at=timezone.now() - timedelta(minutes=10),
+    )
+
+    reconcile_resp = client.post("/api/v1/bundler/jobs/reconcile")
+    assert reconcile_resp.status_code == 200, reconcile_resp.json()
+    assert reconcile_resp.json() == {"processed": 1, "requeued": 1, "failed": 0}
+
+    job = BundlerJob.objects.get(id=job_id)
+    assert job.status == BundlerJob.Status.RETRYING
+
+    events = client.get(f"/api/v1/bundler/operations/{operation_id}/events").json()
+    assert [event["event_type"] for event in events] == ["queued", "dispatching", "requeued"]
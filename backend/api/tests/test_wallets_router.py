@@ -0,0 +1,50 @@
+"""Tests for the wallets router."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from django.contrib.auth import get_user_model
+
+from api.main import app
+from api.dependencies import get_current_user
+
+User = get_user_model()
+
+
+@pytest.fixture
+def client(db):
+    """TestClient authenticated as a fresh user."""
+
+    user = User.objects.create_user(email="wallet_router@example.com", password="StrongPass123!")
+    app.dependency_overrides[get_current_user] = lambda: user
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def _payload(**overrides) -> dict:
+    payload = {
+        "smart_account_address": "0x" + "Ab" * 20,
+        "owner_address": "0x" + "12" * 20,
+        "wallet_type": "smart",
+        "chain_id": 8453,
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_wallet_rejects_malformed_address(client):
+    response = client.post("/api/v1/wallets", json=_payload(owner_address="not-an-address"))
+    assert response.status_code == 422
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_wallet_stores_lowercase_addresses(client):
+    response = client.post("/api/v1/wallets", json=_payload())
+    assert response.status_code == 201
+    assert response.json()["smart_account_address"] == "0x" + "ab" * 20
+
+    duplicate = client.post("/api/v1/wallets", json=_payload())
+    assert duplicate.status_code == 400
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:49
+
+import core.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "bundler",
+            "0002_rename_bundler_job_status_7ea6bd_idx_bundler_bun_status_89fec0_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bundlerjob",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="useroperation",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="useroperationevent",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
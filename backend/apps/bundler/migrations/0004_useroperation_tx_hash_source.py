@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:52
+
+from django.db import migrations, models
+
+
+def backfill_hot_metadata(apps, schema_editor):
+    """Copy tx_hash/source out of metadata into the new columns."""
+    UserOperation = apps.get_model("bundler", "UserOperation")
+    for operation in UserOperation.objects.filter(metadata__has_key="tx_hash").iterator():
+        metadata = dict(operation.metadata)
+        operation.tx_hash = metadata.pop("tx_hash")
+        operation.metadata = metadata
+        operation.save(update_fields=["tx_hash", "metadata"])
+    for operation in UserOperation.objects.filter(metadata__has_key="source").iterator():
+        operation.source = str(operation.metadata["source"])[:32]
+        operation.save(update_fields=["source"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bundler", "0003_useroperation_uuid7_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useroperation",
+            name="source",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="useroperation",
+            name="tx_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=66, null=True),
+        ),
+        migrations.RunPython(backfill_hot_metadata, migrations.RunPython.noop),
+    ]
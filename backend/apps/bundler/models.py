@@ -1,10 +1,11 @@
 """Data models for the bundler gateway domain."""
 
-import uuid
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from core.identifiers import uuid7
+
 
 class UserOperation(models.Model):
     """Queue record for a user operation that will be dispatched to a bundler."""
@@ -16,7 +17,8 @@ class UserOperation(models.Model):
         FAILED = "failed", "Failed"
         DROPPED = "dropped", "Dropped"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered ids keep PK/FK index inserts on the rightmost B-tree page
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     chain_id = models.PositiveBigIntegerField(db_index=True)
     sender = models.CharField(max_length=42, db_index=True)
     wallet = models.ForeignKey(
@@ -52,6 +54,9 @@ class UserOperation(models.Model):
     )
     failure_reason = models.TextField(blank=True)
     metadata = models.JSONField(default=dict, blank=True)
+    # Hot metadata keys promoted to columns so lookups use a B-tree index
+    tx_hash = models.CharField(max_length=66, null=True, blank=True, db_index=True)
+    source = models.CharField(max_length=32, blank=True)
 
     queued_at = models.DateTimeField(default=timezone.now, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -88,7 +93,7 @@ class BundlerJob(models.Model):
         FAILED = "failed", "Failed"
         RETRYING = "retrying", "Retrying"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user_operation = models.ForeignKey(
         UserOperation,
         on_delete=models.CASCADE,
@@ -132,7 +137,7 @@ class BundlerJob(models.Model):
 class UserOperationEvent(models.Model):
     """Structured audit log for user operation lifecycle events."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user_operation = models.ForeignKey(
         UserOperation,
         on_delete=models.CASCADE,
@@ -6,11 +6,14 @@ from .models import GasSponsorship, GasSponsorshipHistory
 
 @admin.register(GasSponsorship)
 class GasSponsorshipAdmin(admin.ModelAdmin):
-    list_display = ['user', 'chain_id', 'daily_limit', 'used_today', 'kyc_multiplier', 'is_active', 'last_reset_date']
+    list_display = ['user', 'chain_id', 'daily_limit', 'used_today', 'kyc_multiplier_bps', 'is_active', 'last_reset_date']
     list_filter = ['chain_id', 'is_active', 'is_verified', 'last_reset_date']
     search_fields = ['user__email']
     readonly_fields = ['id', 'created_at', 'updated_at', 'total_gas_sponsored', 'transactions_sponsored']
     ordering = ['-created_at']
+    list_select_related = ['user']
+    list_per_page = 50
+    show_full_result_count = False
 
 @admin.register(GasSponsorshipHistory)
 class GasSponsorshipHistoryAdmin(admin.ModelAdmin):
@@ -19,3 +22,7 @@ class GasSponsorshipHistoryAdmin(admin.ModelAdmin):
     search_fields = ['sponsorship__user__email', 'transaction__tx_hash']
     readonly_fields = ['id', 'created_at']
     ordering = ['-created_at']
+    list_select_related = ['sponsorship__user']
+    raw_id_fields = ['sponsorship', 'transaction']
+    list_per_page = 50
+    show_full_result_count = False
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "gas_sponsorship",
+            "0005_rename_gas_sponsor_paymast_dfab4d_idx_gas_sponsor_paymast_9ddbe3_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gassponsorship",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "chain_id"],
+                name="gas_spons_active_user_chain",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paymasterreplenishmentrequest",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["paymaster_address"],
+                name="replenish_pending_addr",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gas_sponsorship", "0006_partial_active_pending_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="gassponsorship",
+            name="gas_sponsor_user_id_4930af_idx",
+        ),
+    ]
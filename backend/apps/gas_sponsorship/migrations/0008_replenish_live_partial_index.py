@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gas_sponsorship", "0007_drop_duplicate_user_chain_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="paymasterreplenishmentrequest",
+            name="gas_sponsor_status_391ea9_idx",
+        ),
+        migrations.AddIndex(
+            model_name="paymasterreplenishmentrequest",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "executing"])),
+                fields=["created_at"],
+                name="replenish_live_created",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def multiplier_to_bps(apps, schema_editor):
+    GasSponsorship = apps.get_model("gas_sponsorship", "GasSponsorship")
+    for multiplier in GasSponsorship.objects.values_list("kyc_multiplier", flat=True).distinct():
+        GasSponsorship.objects.filter(kyc_multiplier=multiplier).update(
+            kyc_multiplier_bps=int(multiplier * 10000)
+        )
+
+
+def bps_to_multiplier(apps, schema_editor):
+    GasSponsorship = apps.get_model("gas_sponsorship", "GasSponsorship")
+    for bps in GasSponsorship.objects.values_list("kyc_multiplier_bps", flat=True).distinct():
+        GasSponsorship.objects.filter(kyc_multiplier_bps=bps).update(
+            kyc_multiplier=Decimal(bps) / 10000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gas_sponsorship", "0008_replenish_live_partial_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gassponsorship",
+            name="kyc_multiplier_bps",
+            field=models.PositiveIntegerField(
+                default=10000,
+                help_text="Multiplier based on KYC tier, in basis points (10000 = 1.00x)",
+                verbose_name="KYC multiplier (bps)",
+            ),
+        ),
+        migrations.RunPython(multiplier_to_bps, bps_to_multiplier),
+        migrations.RemoveField(
+            model_name="gassponsorship",
+            name="kyc_multiplier",
+        ),
+    ]
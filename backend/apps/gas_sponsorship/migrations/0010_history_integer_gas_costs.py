@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, Value
+from django.db.models.functions import Cast, Round
+
+# Both directions are one set-based UPDATE, so the history table is never
+# loaded into Python. Scaling by a multiplier (not a divisor) keeps
+# PostgreSQL's numeric arithmetic exact.
+
+
+def decimals_to_integers(apps, schema_editor):
+    GasSponsorshipHistory = apps.get_model("gas_sponsorship", "GasSponsorshipHistory")
+    GasSponsorshipHistory.objects.update(
+        gas_cost_wei=Cast(Round(F("gas_cost_native") * Value(10**18)), models.BigIntegerField()),
+        gas_cost_usd_micros=Cast(Round(F("gas_cost_usd") * Value(10**6)), models.BigIntegerField()),
+    )
+
+
+def integers_to_decimals(apps, schema_editor):
+    GasSponsorshipHistory = apps.get_model("gas_sponsorship", "GasSponsorshipHistory")
+    GasSponsorshipHistory.objects.update(
+        gas_cost_native=Cast(
+            F("gas_cost_wei") * Value(Decimal("1E-18")),
+            models.DecimalField(max_digits=36, decimal_places=18),
+        ),
+        gas_cost_usd=Cast(
+            F("gas_cost_usd_micros") * Value(Decimal("1E-6")),
+            models.DecimalField(max_digits=12, decimal_places=2),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gas_sponsorship", "0009_kyc_multiplier_bps"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gassponsorshiphistory",
+            name="gas_cost_wei",
+            field=models.BigIntegerField(
+                default=0, help_text="Gas cost in wei", verbose_name="gas cost (wei)"
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="gassponsorshiphistory",
+            name="gas_cost_usd_micros",
+            field=models.BigIntegerField(
+                blank=True,
+                help_text="Gas cost in millionths of a US dollar",
+                null=True,
+                verbose_name="gas cost (micro-USD)",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="gassponsorshiphistory",
+            name="gas_cost_native",
+            field=models.DecimalField(
+                decimal_places=18, max_digits=36, null=True,
+                verbose_name="gas cost (native token)",
+            ),
+        ),
+        migrations.RunPython(decimals_to_integers, integers_to_decimals),
+        migrations.RemoveField(
+            model_name="gassponsorshiphistory",
+            name="gas_cost_native",
+        ),
+        migrations.RemoveField(
+            model_name="gassponsorshiphistory",
+            name="gas_cost_usd",
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gas_sponsorship", "0010_history_integer_gas_costs"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="gassponsorshiphistory",
+            name="gas_sponsor_sponsor_205d55_idx",
+        ),
+        migrations.AddIndex(
+            model_name="gassponsorshiphistory",
+            index=models.Index(
+                fields=["sponsorship", "-created_at"],
+                include=("gas_amount", "gas_cost_usd_micros"),
+                name="gas_hist_spons_cover",
+            ),
+        ),
+    ]
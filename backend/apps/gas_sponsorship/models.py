@@ -3,11 +3,15 @@ Gas Sponsorship Models - Track gas sponsorship and limits
 """
 import uuid
 from datetime import timedelta
+from decimal import Decimal
 from typing import Optional
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Greatest
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
@@ -37,12 +41,10 @@ class GasSponsorship(models.Model):
     )
     
     # KYC multiplier
-    kyc_multiplier = models.DecimalField(
-        _('KYC multiplier'),
-        max_digits=4,
-        decimal_places=2,
-        default=1.0,
-        help_text=_('Multiplier based on KYC tier')
+    kyc_multiplier_bps = models.PositiveIntegerField(
+        _('KYC multiplier (bps)'),
+        default=10000,
+        help_text=_('Multiplier based on KYC tier, in basis points (10000 = 1.00x)')
     )
     
     # Reset tracking
@@ -81,27 +83,45 @@ class GasSponsorship(models.Model):
         unique_together = [['user', 'chain_id']]
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', 'chain_id']),
             models.Index(fields=['last_reset_date']),
+            models.Index(
+                fields=['user', 'chain_id'],
+                condition=Q(is_active=True),
+                name='gas_spons_active_user_chain',
+            ),
         ]
     
+    # Counters written by record_usage
+    USAGE_FIELDS = (
+        'used_today',
+        'last_reset_date',
+        'total_gas_sponsored',
+        'transactions_sponsored',
+        'updated_at',
+    )
+    
     def __str__(self):
         return f"{self.user.email} - Chain {self.chain_id} - {self.used_today}/{self.daily_limit}"
     
     def reset_if_needed(self):
         """Reset daily usage if 24 hours have passed"""
         today = timezone.now().date()
-        if self.last_reset_date < today:
-            self.used_today = 0
-            self.last_reset_date = today
-            self.save(update_fields=['used_today', 'last_reset_date', 'updated_at'])
-            return True
-        return False
+        if self.last_reset_date >= today:
+            return False
+        # Guarded on the stored date so a concurrent reset/increment wins
+        # instead of being overwritten by this instance's stale counters
+        GasSponsorship.objects.filter(pk=self.pk, last_reset_date__lt=today).update(
+            used_today=0,
+            last_reset_date=today,
+            updated_at=timezone.now(),
+        )
+        self.refresh_from_db(fields=['used_today', 'last_reset_date', 'updated_at'])
+        return True
     
-    @property
+    @cached_property
     def effective_daily_limit(self):
         """Get effective daily limit with KYC multiplier"""
-        return int(self.daily_limit * float(self.kyc_multiplier))
+        return (self.daily_limit * self.kyc_multiplier_bps) // 10000
     
     @property
     def remaining_today(self):
@@ -121,17 +141,26 @@ class GasSponsorship(models.Model):
         return self.is_active and self.remaining_today >= gas_amount
     
     def record_usage(self, gas_amount):
-        """Record gas usage"""
-        self.reset_if_needed()
-        self.used_today += gas_amount
-        self.total_gas_sponsored += gas_amount
-        self.transactions_sponsored += 1
-        self.save(update_fields=[
-            'used_today',
-            'total_gas_sponsored',
-            'transactions_sponsored',
-            'updated_at'
-        ])
+        """
+        Record gas usage
+
+        Day rollover and counter increments are applied in a single UPDATE,
+        so concurrent sponsorships neither double-reset nor lose increments.
+        """
+        today = timezone.now().date()
+        GasSponsorship.objects.filter(pk=self.pk).update(
+            used_today=Case(
+                When(last_reset_date__lt=today, then=Value(gas_amount)),
+                default=F('used_today') + gas_amount,
+            ),
+            last_reset_date=Greatest(F('last_reset_date'), Value(today)),
+            total_gas_sponsored=F('total_gas_sponsored') + gas_amount,
+            transactions_sponsored=F('transactions_sponsored') + 1,
+            updated_at=timezone.now(),
+        )
+        # Defer the stale in-memory values; they reload on next access
+        for field in (*self.USAGE_FIELDS, 'effective_daily_limit'):
+            self.__dict__.pop(field, None)
 
 
 class GasSponsorshipHistory(models.Model):
@@ -162,17 +191,15 @@ class GasSponsorshipHistory(models.Model):
         _('gas price'),
         help_text=_('Gas price at time of sponsorship (wei)')
     )
-    gas_cost_native = models.DecimalField(
-        _('gas cost (native token)'),
-        max_digits=36,
-        decimal_places=18
+    gas_cost_wei = models.BigIntegerField(
+        _('gas cost (wei)'),
+        help_text=_('Gas cost in wei')
     )
-    gas_cost_usd = models.DecimalField(
-        _('gas cost (USD)'),
-        max_digits=12,
-        decimal_places=2,
+    gas_cost_usd_micros = models.BigIntegerField(
+        _('gas cost (micro-USD)'),
         null=True,
-        blank=True
+        blank=True,
+        help_text=_('Gas cost in millionths of a US dollar')
     )
     
     # Timestamp
@@ -183,12 +210,28 @@ class GasSponsorshipHistory(models.Model):
         verbose_name_plural = _('gas sponsorship histories')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['sponsorship', '-created_at']),
+            models.Index(
+                fields=['sponsorship', '-created_at'],
+                include=['gas_amount', 'gas_cost_usd_micros'],
+                name='gas_hist_spons_cover',
+            ),
             models.Index(fields=['transaction']),
         ]
     
     def __str__(self):
         return f"{self.sponsorship.user.email} - {self.gas_amount} wei - {self.created_at}"
+    
+    @property
+    def gas_cost_native(self):
+        """Gas cost in whole native tokens, for display"""
+        return Decimal(self.gas_cost_wei) / Decimal(10**18)
+    
+    @property
+    def gas_cost_usd(self):
+        """Gas cost in US dollars, for display"""
+        if self.gas_cost_usd_micros is None:
+            return None
+        return Decimal(self.gas_cost_usd_micros) / Decimal(10**6)
 
 
 class PaymasterBudgetSnapshot(models.Model):
@@ -268,8 +311,17 @@ class PaymasterReplenishmentRequest(models.Model):
         verbose_name_plural = _('paymaster replenishment requests')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status', 'created_at']),
+            models.Index(
+                fields=['created_at'],
+                condition=Q(status__in=['pending', 'executing']),
+                name='replenish_live_created',
+            ),
             models.Index(fields=['paymaster_address', 'status']),
+            models.Index(
+                fields=['paymaster_address'],
+                condition=Q(status='pending'),
+                name='replenish_pending_addr',
+            ),
         ]
 
     def mark_status(self, status: str, *, error: Optional[str] = None) -> None:
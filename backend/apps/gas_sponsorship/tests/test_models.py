@@ -0,0 +1,89 @@
+"""
+Tests for gas sponsorship models
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.gas_sponsorship.models import GasSponsorship
+
+User = get_user_model()
+
+
+@pytest.fixture
+def sponsorship(db):
+    """Create a sponsorship row with some usage recorded today"""
+    user = User.objects.create_user(email="sponsor@example.com", password="TestPass123!")
+    return GasSponsorship.objects.create(
+        user=user,
+        chain_id=4202,
+        daily_limit=1_000_000,
+        used_today=100,
+        total_gas_sponsored=500,
+        transactions_sponsored=5,
+        last_reset_date=timezone.now().date(),
+    )
+
+
+class TestRecordUsage:
+    """Test GasSponsorship.record_usage"""
+
+    def test_increments_counters(self, sponsorship):
+        """Usage on the same day is added to the running counters"""
+        sponsorship.record_usage(50)
+
+        assert sponsorship.used_today == 150
+        assert sponsorship.total_gas_sponsored == 550
+        assert sponsorship.transactions_sponsored == 6
+
+    def test_rolls_over_stale_day(self, sponsorship):
+        """The first usage on a new day replaces yesterday's total"""
+        yesterday = timezone.now().date() - timedelta(days=1)
+        GasSponsorship.objects.filter(pk=sponsorship.pk).update(last_reset_date=yesterday)
+
+        sponsorship.record_usage(50)
+
+        sponsorship.refresh_from_db()
+        assert sponsorship.used_today == 50
+        assert sponsorship.last_reset_date == timezone.now().date()
+        assert sponsorship.total_gas_sponsored == 550
+
+    def test_stale_instances_do_not_lose_updates(self, sponsorship):
+        """Two in-memory copies both land their increments"""
+        other = GasSponsorship.objects.get(pk=sponsorship.pk)
+
+        sponsorship.record_usage(10)
+        other.record_usage(20)
+
+        sponsorship.refresh_from_db()
+        assert sponsorship.used_today == 130
+        assert sponsorship.transactions_sponsored == 7
+
+
+class TestEffectiveDailyLimit:
+    """Test GasSponsorship.effective_daily_limit"""
+
+    def test_applies_basis_points(self, sponsorship):
+        """The KYC multiplier scales the daily limit in basis points"""
+        sponsorship.kyc_multiplier_bps = 15_000
+
+        assert sponsorship.effective_daily_limit == 1_500_000
+        assert sponsorship.remaining_today == 1_499_900
+
+
+class TestResetIfNeeded:
+    """Test GasSponsorship.reset_if_needed"""
+
+    def test_does_not_clobber_concurrent_usage(self, sponsorship):
+        """A stale instance cannot reset a row another worker already rolled over"""
+        yesterday = timezone.now().date() - timedelta(days=1)
+        GasSponsorship.objects.filter(pk=sponsorship.pk).update(last_reset_date=yesterday)
+        stale = GasSponsorship.objects.get(pk=sponsorship.pk)
+
+        sponsorship.record_usage(50)
+
+        assert stale.reset_if_needed() is True
+        assert stale.used_today == 50
+
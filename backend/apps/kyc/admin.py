@@ -11,6 +11,7 @@ class KYCVerificationAdmin(admin.ModelAdmin):
     search_fields = ['user__email', 'full_name', 'id_number', 'bvn']
     readonly_fields = ['id', 'submitted_at', 'reviewed_at', 'approved_at']
     ordering = ['-submitted_at']
+    list_select_related = ['user', 'reviewer']
     
     fieldsets = (
         ('User', {'fields': ('user', 'tier', 'status')}),
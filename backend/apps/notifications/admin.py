@@ -2,6 +2,9 @@
 Notifications Admin Configuration
 """
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.db.models import Q
 from .models import Notification, PushToken, NotificationPreference
 
 @admin.register(Notification)
@@ -11,6 +14,20 @@ class NotificationAdmin(admin.ModelAdmin):
     search_fields = ['user__email', 'title', 'message']
     readonly_fields = ['id', 'created_at', 'read_at']
     ordering = ['-created_at']
+    list_select_related = ['user']
+    
+    def get_search_results(self, request, queryset, search_term):
+        # On PostgreSQL use the GIN-indexed search vector instead of
+        # ILIKE scans over title and message. The config must match the
+        # one the vector is built with (notifications 0007), not the
+        # cluster's default_text_search_config
+        if connection.vendor != 'postgresql' or not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        queryset = queryset.filter(
+            Q(search_vector=SearchQuery(search_term, config='english'))
+            | Q(user__email__iexact=search_term)
+        )
+        return queryset, False
 
 @admin.register(PushToken)
 class PushTokenAdmin(admin.ModelAdmin):
@@ -18,6 +35,7 @@ class PushTokenAdmin(admin.ModelAdmin):
     list_filter = ['device_type', 'is_active', 'created_at']
     search_fields = ['user__email', 'token', 'device_name']
     readonly_fields = ['id', 'created_at', 'last_used_at']
+    list_select_related = ['user']
 
 @admin.register(NotificationPreference)
 class NotificationPreferenceAdmin(admin.ModelAdmin):
@@ -25,3 +43,4 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
     list_filter = ['push_enabled', 'email_enabled', 'sms_enabled', 'dnd_enabled']
     search_fields = ['user__email']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    list_select_related = ['user']
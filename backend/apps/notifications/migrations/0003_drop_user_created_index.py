@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:55
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_user_id_05b4bc_idx",
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:59
+
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0005_expires_partial_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                django.db.models.fields.json.KeyTextTransform("tx_hash", "metadata"),
+                name="notif_tx_hash_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:02
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# PostgreSQL only: other backends keep the column empty and the admin
+# falls back to its regular LIKE search.
+CREATE_SEARCH = """
+CREATE INDEX IF NOT EXISTS notif_search_vector_gin
+    ON notifications_notification USING gin (search_vector);
+
+CREATE TRIGGER notif_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, message ON notifications_notification
+    FOR EACH ROW EXECUTE FUNCTION
+    tsvector_update_trigger(search_vector, 'pg_catalog.english', title, message);
+
+UPDATE notifications_notification
+    SET search_vector = to_tsvector('pg_catalog.english', coalesce(title, '') || ' ' || coalesce(message, ''));
+"""
+
+DROP_SEARCH = """
+DROP TRIGGER IF EXISTS notif_search_vector_update ON notifications_notification;
+DROP INDEX IF EXISTS notif_search_vector_gin;
+"""
+
+
+def create_search(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SEARCH)
+
+
+def drop_search(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0006_metadata_tx_hash_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search, drop_search),
+    ]
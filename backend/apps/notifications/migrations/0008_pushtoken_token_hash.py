@@ -0,0 +1,47 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_token_hash(apps, schema_editor):
+    PushToken = apps.get_model("notifications", "PushToken")
+    tokens = list(PushToken.objects.only("id", "token"))
+    for push_token in tokens:
+        push_token.token_hash = hashlib.sha256(push_token.token.encode()).digest()
+    PushToken.objects.bulk_update(tokens, ["token_hash"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0007_notification_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pushtoken",
+            name="token_hash",
+            field=models.BinaryField(editable=False, max_length=32, null=True),
+        ),
+        migrations.RunPython(backfill_token_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="pushtoken",
+            name="token_hash",
+            field=models.BinaryField(
+                editable=False,
+                help_text="SHA-256 of the token; fixed-size unique lookup key",
+                max_length=32,
+                unique=True,
+                verbose_name="push token hash",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="pushtoken",
+            name="notificatio_token_454efe_idx",
+        ),
+        migrations.AlterField(
+            model_name="pushtoken",
+            name="token",
+            field=models.CharField(max_length=255, verbose_name="push token"),
+        ),
+    ]
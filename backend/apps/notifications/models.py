@@ -1,8 +1,13 @@
 """
 Notification Models - Multi-channel notifications
 """
+import hashlib
 import uuid
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
+from django.db.models.fields.json import KeyTextTransform
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
@@ -79,14 +84,32 @@ class Notification(models.Model):
     created_at = models.DateTimeField(_('created at'), auto_now_add=True, db_index=True)
     expires_at = models.DateTimeField(_('expires at'), null=True, blank=True)
     
+    # Full-text search over title and message; kept up to date by a
+    # trigger and GIN-indexed on PostgreSQL (migration 0007)
+    search_vector = SearchVectorField(null=True, editable=False)
+    
     class Meta:
         verbose_name = _('notification')
         verbose_name_plural = _('notifications')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', '-created_at']),
             models.Index(fields=['user', 'is_read', '-created_at']),
             models.Index(fields=['notification_type', '-created_at']),
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=Q(is_read=False),
+                name='notif_unread_user_created',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=Q(expires_at__isnull=False),
+                name='notif_expires_idx',
+            ),
+            # Finds the notifications raised for a given on-chain transaction
+            models.Index(
+                KeyTextTransform('tx_hash', 'metadata'),
+                name='notif_tx_hash_idx',
+            ),
         ]
     
     def __str__(self):
@@ -94,11 +117,65 @@ class Notification(models.Model):
     
     def mark_as_read(self):
         """Mark notification as read"""
-        if not self.is_read:
-            from django.utils import timezone
+        read_at = timezone.now()
+        updated = Notification.objects.filter(pk=self.pk, is_read=False).update(
+            is_read=True,
+            read_at=read_at,
+        )
+        if updated:
             self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            self.read_at = read_at
+    
+    @classmethod
+    def mark_all_read(cls, user):
+        """Mark every unread notification for a user as read in one statement"""
+        return cls.objects.filter(user=user, is_read=False).update(
+            is_read=True,
+            read_at=timezone.now(),
+        )
+    
+    @classmethod
+    def bulk_send(cls, user_ids, *, title, message, notification_type, metadata=None, batch_size=1000):
+        """
+        Create the same notification for many users with multi-row INSERTs
+        
+        Returns:
+            List of created notifications
+        """
+        metadata = metadata or {}
+        notifications = [
+            cls(
+                user_id=user_id,
+                title=title,
+                message=message,
+                notification_type=notification_type,
+                metadata=metadata,
+            )
+            for user_id in user_ids
+        ]
+        return cls.objects.bulk_create(notifications, batch_size=batch_size)
+    
+    @classmethod
+    def purge_expired(cls, batch_size=10_000):
+        """
+        Delete expired notifications in primary-key batches
+        
+        Keeps each DELETE short so the purge never holds long locks on
+        the table users are reading their feeds from.
+        
+        Returns:
+            Number of notifications deleted
+        """
+        now = timezone.now()
+        deleted = 0
+        while True:
+            batch = list(
+                cls.objects.filter(expires_at__lt=now).values_list('pk', flat=True)[:batch_size]
+            )
+            if not batch:
+                return deleted
+            count, _ = cls.objects.filter(pk__in=batch).delete()
+            deleted += count
 
 
 class PushToken(models.Model):
@@ -120,11 +197,13 @@ class PushToken(models.Model):
     )
     
     # Token details
-    token = models.CharField(
-        _('push token'),
-        max_length=255,
+    token = models.CharField(_('push token'), max_length=255)
+    token_hash = models.BinaryField(
+        _('push token hash'),
+        max_length=32,
         unique=True,
-        db_index=True
+        editable=False,
+        help_text=_('SHA-256 of the token; fixed-size unique lookup key')
     )
     device_type = models.CharField(
         _('device type'),
@@ -146,11 +225,28 @@ class PushToken(models.Model):
         ordering = ['-last_used_at']
         indexes = [
             models.Index(fields=['user', 'is_active']),
-            models.Index(fields=['token']),
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.device_type} - {self.token[:20]}..."
+    
+    def save(self, *args, **kwargs):
+        """Keep token_hash in sync with token"""
+        self.token_hash = self.hash_token(self.token)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'token' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'token_hash'}
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def hash_token(token):
+        """Lookup key for a raw device token"""
+        return hashlib.sha256(token.encode()).digest()
+    
+    @classmethod
+    def get_by_token(cls, token):
+        """Fetch a push token by its raw value through the hash index"""
+        return cls.objects.get(token_hash=cls.hash_token(token))
 
 
 class NotificationPreference(models.Model):
@@ -0,0 +1,16 @@
+"""Celery tasks for notification housekeeping."""
+
+import logging
+from celery import shared_task
+
+from apps.notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='apps.notifications.tasks.cleanup_old_notifications')
+def cleanup_old_notifications(batch_size: int = 10_000) -> dict:
+    """Delete notifications whose expires_at has passed."""
+    deleted = Notification.purge_expired(batch_size=batch_size)
+    logger.info("🧹 Purged %s expired notifications", deleted)
+    return {'deleted': deleted}
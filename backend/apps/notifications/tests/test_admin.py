@@ -0,0 +1,48 @@
+"""
+Tests for the notifications admin
+"""
+from types import SimpleNamespace
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+
+from apps.notifications import admin as notifications_admin
+from apps.notifications.models import Notification
+
+User = get_user_model()
+
+
+@pytest.fixture
+def notification(db):
+    user = User.objects.create_user(email="search@example.com", password="TestPass123!")
+    return Notification.objects.create(
+        user=user,
+        title="Payment received",
+        message="You received 10 HBAR",
+        notification_type=Notification.NotificationType.PAYMENT,
+    )
+
+
+class TestNotificationSearch:
+    """Test NotificationAdmin.get_search_results"""
+
+    def test_postgres_search_uses_english_config(self, notification, rf, monkeypatch):
+        """The query is parsed with the config the search vector is built with"""
+        monkeypatch.setattr(notifications_admin, "connection", SimpleNamespace(vendor="postgresql"))
+        model_admin = admin.site._registry[Notification]
+
+        queryset, may_have_duplicates = model_admin.get_search_results(
+            rf.get("/"), Notification.objects.all(), "payments"
+        )
+
+        _, params = queryset.query.sql_with_params()
+        assert "english" in params
+        assert not may_have_duplicates
+
+    def test_search_matches_title_without_postgres(self, notification, admin_client):
+        """Other backends fall back to the regular field search"""
+        response = admin_client.get("/admin/notifications/notification/", {"q": "received"})
+
+        assert response.status_code == 200
+        assert list(response.context["cl"].result_list) == [notification]
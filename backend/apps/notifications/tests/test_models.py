@@ -0,0 +1,131 @@
+"""
+Tests for notification models
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.notifications.models import Notification, PushToken
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    """Create a user to own notifications"""
+    return User.objects.create_user(email="notify@example.com", password="TestPass123!")
+
+
+def _notify(user, **kwargs):
+    return Notification.objects.create(
+        user=user,
+        title="Payment received",
+        message="You received 10 HBAR",
+        notification_type=Notification.NotificationType.PAYMENT,
+        **kwargs,
+    )
+
+
+class TestMarkAsRead:
+    """Test Notification.mark_as_read and mark_all_read"""
+
+    def test_mark_as_read_sets_read_at(self, user):
+        """Unread notifications are flagged and timestamped"""
+        notification = _notify(user)
+
+        notification.mark_as_read()
+
+        notification.refresh_from_db()
+        assert notification.is_read is True
+        assert notification.read_at is not None
+
+    def test_mark_as_read_keeps_original_timestamp(self, user):
+        """Marking an already-read notification does not rewrite read_at"""
+        notification = _notify(user)
+        notification.mark_as_read()
+        notification.refresh_from_db()
+        first_read_at = notification.read_at
+
+        stale = Notification.objects.get(pk=notification.pk)
+        stale.is_read = False
+        stale.mark_as_read()
+
+        notification.refresh_from_db()
+        assert notification.read_at == first_read_at
+
+    def test_mark_all_read_only_touches_user(self, user):
+        """Only the given user's unread notifications are updated"""
+        other = User.objects.create_user(email="other@example.com", password="TestPass123!")
+        _notify(user)
+        _notify(user)
+        _notify(user, is_read=True)
+        _notify(other)
+
+        assert Notification.mark_all_read(user) == 2
+        assert not Notification.objects.filter(user=user, is_read=False).exists()
+        assert Notification.objects.filter(user=other, is_read=False).count() == 1
+
+
+class TestBulkSend:
+    """Test Notification.bulk_send"""
+
+    def test_creates_one_per_user(self, user):
+        """Each recipient gets their own copy of the notification"""
+        other = User.objects.create_user(email="other@example.com", password="TestPass123!")
+
+        created = Notification.bulk_send(
+            [user.id, other.id],
+            title="Maintenance",
+            message="Scheduled downtime tonight",
+            notification_type=Notification.NotificationType.SYSTEM,
+        )
+
+        assert len(created) == 2
+        assert Notification.objects.filter(title="Maintenance").count() == 2
+        assert set(Notification.objects.values_list("user_id", flat=True)) == {user.id, other.id}
+
+
+class TestPurgeExpired:
+    """Test Notification.purge_expired"""
+
+    def test_deletes_only_expired(self, user):
+        """Expired rows go in batches; unexpired and open-ended rows stay"""
+        now = timezone.now()
+        for _ in range(3):
+            _notify(user, expires_at=now - timedelta(days=1))
+        kept = _notify(user, expires_at=now + timedelta(days=1))
+        forever = _notify(user)
+
+        assert Notification.purge_expired(batch_size=2) == 3
+        assert set(Notification.objects.values_list("pk", flat=True)) == {kept.pk, forever.pk}
+
+
+class TestPushTokenHash:
+    """Test PushToken.token_hash maintenance"""
+
+    def test_lookup_by_token(self, user):
+        """Saving derives the hash and lookups go through it"""
+        push_token = PushToken.objects.create(
+            user=user,
+            token="fcm:" + "a" * 150,
+            device_type=PushToken.DeviceType.ANDROID,
+        )
+
+        assert len(bytes(push_token.token_hash)) == 32
+        assert PushToken.get_by_token("fcm:" + "a" * 150).pk == push_token.pk
+
+    def test_update_fields_refreshes_hash(self, user):
+        """Rotating the token with update_fields also rewrites the hash"""
+        push_token = PushToken.objects.create(
+            user=user,
+            token="old-token",
+            device_type=PushToken.DeviceType.IOS,
+        )
+
+        push_token.token = "new-token"
+        push_token.save(update_fields=["token"])
+
+        assert PushToken.get_by_token("new-token").pk == push_token.pk
+        assert not PushToken.objects.filter(token_hash=PushToken.hash_token("old-token")).exists()
@@ -2,6 +2,8 @@
 Payments Admin Configuration
 """
 from django.contrib import admin
+
+from core.admin import CachedCountPaginator
 from .models import Payment
 
 @admin.register(Payment)
@@ -11,3 +13,16 @@ class PaymentAdmin(admin.ModelAdmin):
     search_fields = ['reference', 'provider_reference', 'user__email', 'recipient_id']
     readonly_fields = ['id', 'created_at', 'updated_at', 'completed_at']
     ordering = ['-created_at']
+    list_select_related = ['user']
+    paginator = CachedCountPaginator
+    show_full_result_count = False
+    # Wide columns the changelist never renders
+    changelist_deferred_fields = ['metadata', 'provider_response', 'error_message', 'failure_reason']
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # Trim columns on the changelist only; the change form needs every field
+        changelist_url = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if request.resolver_match and request.resolver_match.url_name == changelist_url:
+            queryset = queryset.defer(*self.changelist_deferred_fields)
+        return queryset
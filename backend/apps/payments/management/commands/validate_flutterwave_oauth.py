@@ -2,9 +2,49 @@
 Django management command to validate Flutterwave OAuth configuration
 Usage: python manage.py validate_flutterwave_oauth
 """
+import asyncio
+
+import httpx
+import orjson
+from django.core.cache import cache
 from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
 from services.payments.oauth_token_service import get_oauth_service
 
+FLUTTERWAVE_API_URL = "https://api.flutterwave.com/v3"
+
+# Read-only endpoints probed with the token, as (path, label)
+PROBE_ENDPOINTS = [
+    ("bill-categories", "bill categories"),
+    ("banks/NG", "Nigerian banks"),
+]
+
+# Upper bound on probes in flight at once
+PROBE_CONCURRENCY = 5
+
+# Last successful token and probe results, shown as STALE during outages
+LAST_OK_CACHE_KEY = "fw:probe:last_ok"
+
+
+async def _probe_all(token):
+    """Run every probe concurrently over one keep-alive client."""
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json',
+    }
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=85.0)
+    semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=30.0) as client:
+        async def probe(path):
+            async with semaphore:
+                return await client.get(f"{FLUTTERWAVE_API_URL}/{path}")
+
+        return await asyncio.gather(
+            *(probe(path) for path, _ in PROBE_ENDPOINTS),
+            return_exceptions=True,
+        )
+
 
 class Command(BaseCommand):
     help = 'Validate Flutterwave OAuth 2.0 configuration and test token generation'
@@ -56,8 +96,10 @@ class Command(BaseCommand):
             self.stdout.write("  (Force refresh enabled)")
         
         token = service.get_access_token(force_refresh=force_refresh)
+        last_ok = cache.get(LAST_OK_CACHE_KEY) or {'token': None, 'probes': {}}
 
         if token:
+            last_ok['token'] = service.get_token_metadata()
             self.stdout.write(self.style.SUCCESS(f"✓ Token obtained successfully"))
             self.stdout.write(f"  Token: {token[:40]}...{token[-10:]}")
             self.stdout.write(f"  Length: {len(token)} characters")
@@ -75,44 +117,15 @@ class Command(BaseCommand):
                     self.stdout.write(f"  Scope: {metadata.get('scope')}")
                     self.stdout.write("")
 
-            # Test API call with token
-            self.stdout.write(self.style.HTTP_INFO("TESTING API CALL:"))
-            self.stdout.write("  Making test request to Flutterwave API...")
+            # Test API calls with token
+            self.stdout.write(self.style.HTTP_INFO("TESTING API CALLS:"))
+            self.stdout.write(f"  Probing {len(PROBE_ENDPOINTS)} read-only Flutterwave endpoints...")
             
-            try:
-                import httpx
-                headers = {
-                    'Authorization': f'Bearer {token}',
-                    'Content-Type': 'application/json',
-                }
-                
-                # Test with bill categories endpoint (read-only, safe)
-                response = httpx.get(
-                    "https://api.flutterwave.com/v3/bill-categories",
-                    headers=headers,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('status') == 'success':
-                        count = len(data.get('data', []))
-                        self.stdout.write(self.style.SUCCESS(
-                            f"✓ API call successful! Found {count} bill categories"
-                        ))
-                    else:
-                        self.stdout.write(self.style.WARNING(
-                            f"⚠ API returned non-success status: {data.get('status')}"
-                        ))
-                else:
-                    self.stdout.write(self.style.ERROR(
-                        f"✗ API returned status {response.status_code}"
-                    ))
-                    self.stdout.write(f"  Response: {response.text[:200]}")
-                
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"✗ API call failed: {e}"))
+            results = asyncio.run(_probe_all(token))
+            for (path, label), response in zip(PROBE_ENDPOINTS, results):
+                self._report_probe(path, label, response, last_ok['probes'])
             
+            cache.set(LAST_OK_CACHE_KEY, last_ok, timeout=None)
             self.stdout.write("")
 
         else:
@@ -123,6 +136,7 @@ class Command(BaseCommand):
             self.stdout.write("  2. Check FLUTTERWAVE_OAUTH_CLIENT_SECRET is set in .env")
             self.stdout.write("  3. Verify credentials are correct in Flutterwave Dashboard")
             self.stdout.write("  4. Check network connectivity to Flutterwave auth server")
+            self._report_stale_token(last_ok['token'])
             raise CommandError("OAuth token generation failed")
 
         # Final summary
@@ -137,3 +151,56 @@ class Command(BaseCommand):
         self.stdout.write("  service = FlutterwaveService()")
         self.stdout.write("  # Token will be automatically managed")
         self.stdout.write("")
+
+    def _report_probe(self, path, label, response, last_probes):
+        """Write the outcome of one probe request and record successes."""
+        if isinstance(response, Exception):
+            self._report_probe_failure(path, label, f"failed: {response}", last_probes)
+            return
+
+        if response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                self._report_probe_failure(path, label, f"returned invalid JSON: {e}", last_probes)
+                self.stdout.write(f"  Response: {response.text[:200]}")
+                return
+
+            if data.get('status') == 'success':
+                count = len(data.get('data', []))
+                last_probes[path] = {
+                    'count': count,
+                    'checked_at': timezone.now().isoformat(),
+                }
+                self.stdout.write(self.style.SUCCESS(
+                    f"✓ /{path} successful! Found {count} {label}"
+                ))
+            else:
+                self.stdout.write(self.style.WARNING(
+                    f"⚠ /{path} returned non-success status: {data.get('status')}"
+                ))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f"✗ /{path} returned status {response.status_code}"
+            ))
+            self.stdout.write(f"  Response: {response.text[:200]}")
+
+    def _report_probe_failure(self, path, label, reason, last_probes):
+        """Write a failed probe and the last successful result for it, if any."""
+        self.stdout.write(self.style.ERROR(f"✗ /{path} {reason}"))
+        last = last_probes.get(path)
+        if last:
+            self.stdout.write(self.style.WARNING(
+                f"  STALE: last OK at {last['checked_at']} with {last['count']} {label}"
+            ))
+
+    def _report_stale_token(self, metadata):
+        """Write the last known good token metadata, if any was recorded."""
+        if not metadata:
+            return
+
+        self.stdout.write("")
+        self.stdout.write(self.style.WARNING("LAST KNOWN GOOD TOKEN (STALE):"))
+        self.stdout.write(f"  Cached At: {metadata.get('cached_at')}")
+        self.stdout.write(f"  Expires At: {metadata.get('expires_at')}")
+        self.stdout.write(f"  Environment: {metadata.get('environment')}")
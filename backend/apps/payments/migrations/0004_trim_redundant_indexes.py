@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payments_pa_referen_75358f_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payments_pa_status_21ed42_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payments_pa_payment_21e38d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payments_pa_provide_52305c_idx",
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "failed"])),
+                fields=["status", "-created_at"],
+                name="payment_open_status_created",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0004_trim_redundant_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="payment",
+            name="payment_open_status_created",
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["-created_at"],
+                name="payments_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("status", "processing")),
+                fields=["-created_at"],
+                name="payments_processing_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("status", "failed")),
+                fields=["-created_at"],
+                name="payments_failed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:15
+
+import core.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0005_per_status_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="payment",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
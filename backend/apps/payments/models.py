@@ -1,11 +1,13 @@
 """
 Payment Models - Bill payments, airtime, and transfers
 """
-import uuid
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
+from core.identifiers import uuid7
+
 
 class Payment(models.Model):
     """
@@ -29,7 +31,8 @@ class Payment(models.Model):
         REFUNDED = 'refunded', _('Refunded')
     
     # Primary fields
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered ids keep PK/FK index inserts on the rightmost B-tree page
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -136,10 +139,23 @@ class Payment(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
-            models.Index(fields=['reference']),
-            models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['payment_type', '-created_at']),
-            models.Index(fields=['provider', '-created_at']),
+            # Monitor/retry tasks poll one small status slice each; the
+            # completed bulk of the table stays out of these indexes
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='pending'),
+                name='payments_pending_idx',
+            ),
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='processing'),
+                name='payments_processing_idx',
+            ),
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='failed'),
+                name='payments_failed_idx',
+            ),
         ]
     
     def __str__(self):
@@ -2,16 +2,30 @@
 Transactions Admin Configuration
 """
 from django.contrib import admin
+
+from core.admin import CachedCountPaginator, ChangelistFieldsMixin
 from .models import Transaction
 
 @admin.register(Transaction)
-class TransactionAdmin(admin.ModelAdmin):
+class TransactionAdmin(ChangelistFieldsMixin, admin.ModelAdmin):
     list_display = ['short_hash', 'user', 'tx_type', 'amount', 'token_symbol', 'status', 'network', 'gas_sponsored', 'created_at']
     list_filter = ['tx_type', 'status', 'network', 'gas_sponsored', 'created_at']
     search_fields = ['tx_hash', 'user__email', 'from_address', 'to_address']
     readonly_fields = ['id', 'created_at', 'updated_at', 'confirmed_at']
     ordering = ['-created_at']
+    paginator = CachedCountPaginator
+    show_full_result_count = False
     
+    @admin.display(description='TX Hash', ordering='tx_hash')
     def short_hash(self, obj):
-        return obj.short_hash
-    short_hash.short_description = 'TX Hash'
+        tx_hash = obj.tx_hash
+        return f"{tx_hash[:10]}...{tx_hash[-8:]}"
+    
+    # Columns the changelist actually renders (list_display + ordering)
+    changelist_fields = [
+        'id', 'tx_hash', 'tx_type', 'amount', 'token_symbol', 'status',
+        'network', 'gas_sponsored', 'created_at', 'user', 'user__email',
+    ]
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
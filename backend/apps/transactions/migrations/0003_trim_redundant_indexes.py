@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_tx_hash_2e17d1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_status_4b1739_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_tx_type_7351f8_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transaction",
+            name="transaction_block_n_d19260_idx",
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["-created_at"],
+                name="tx_pending_created",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:16
+
+import core.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0003_trim_redundant_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="transaction",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0004_uuid7_ids"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="transaction",
+            name="from_address",
+            field=models.CharField(max_length=42, verbose_name="from address"),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="to_address",
+            field=models.CharField(max_length=42, verbose_name="to address"),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="token_symbol",
+            field=models.CharField(max_length=20, verbose_name="token symbol"),
+        ),
+    ]
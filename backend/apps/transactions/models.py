@@ -1,11 +1,21 @@
 """
 Transaction Models - Blockchain transaction tracking
 """
-import uuid
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
-from decimal import Decimal
+
+from core.identifiers import uuid7
+
+# Block explorer transaction URL templates by chain ID
+_EXPLORER_TEMPLATES = {
+    1: 'https://etherscan.io/tx/{}',
+    8453: 'https://basescan.org/tx/{}',
+    42161: 'https://arbiscan.io/tx/{}',
+    10: 'https://optimistic.etherscan.io/tx/{}',
+    137: 'https://polygonscan.com/tx/{}',
+}
 
 
 class Transaction(models.Model):
@@ -30,7 +40,8 @@ class Transaction(models.Model):
         REPLACED = 'replaced', _('Replaced')
     
     # Primary fields
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered ids keep PK/FK index inserts on the rightmost B-tree page
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -67,8 +78,9 @@ class Transaction(models.Model):
     )
     
     # Addresses
-    from_address = models.CharField(_('from address'), max_length=42, db_index=True)
-    to_address = models.CharField(_('to address'), max_length=42, db_index=True)
+    # Looked up through the (address, -created_at) indexes in Meta
+    from_address = models.CharField(_('from address'), max_length=42)
+    to_address = models.CharField(_('to address'), max_length=42)
     
     # Amount and token
     amount = models.DecimalField(
@@ -77,7 +89,7 @@ class Transaction(models.Model):
         decimal_places=18,
         help_text=_('Transaction amount in token units')
     )
-    token_symbol = models.CharField(_('token symbol'), max_length=20, db_index=True)
+    token_symbol = models.CharField(_('token symbol'), max_length=20)
     token_address = models.CharField(
         _('token address'),
         max_length=42,
@@ -152,12 +164,13 @@ class Transaction(models.Model):
         indexes = [
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['wallet', '-created_at']),
-            models.Index(fields=['tx_hash']),
-            models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['tx_type', '-created_at']),
             models.Index(fields=['from_address', '-created_at']),
             models.Index(fields=['to_address', '-created_at']),
-            models.Index(fields=['block_number']),
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='pending'),
+                name='tx_pending_created',
+            ),
         ]
     
     def __str__(self):
@@ -185,17 +198,34 @@ class Transaction(models.Model):
     
     def get_explorer_url(self):
         """Get blockchain explorer URL"""
-        explorers = {
-            1: f'https://etherscan.io/tx/{self.tx_hash}',
-            8453: f'https://basescan.org/tx/{self.tx_hash}',
-            42161: f'https://arbiscan.io/tx/{self.tx_hash}',
-            10: f'https://optimistic.etherscan.io/tx/{self.tx_hash}',
-            137: f'https://polygonscan.com/tx/{self.tx_hash}',
-        }
-        return explorers.get(self.chain_id, f'#')
+        template = _EXPLORER_TEMPLATES.get(self.chain_id)
+        return template.format(self.tx_hash) if template else '#'
     
     def calculate_total_cost(self):
         """Calculate total cost including gas"""
         if self.gas_fee and not self.gas_sponsored:
-            return self.amount + Decimal(str(self.gas_fee))
+            return self.amount + self.gas_fee
         return self.amount
+    
+    @classmethod
+    def bulk_ingest(cls, rows, batch_size=1000):
+        """
+        Insert many transactions with multi-row INSERTs
+        
+        Rows whose tx_hash is already stored are skipped, so backfill jobs
+        can safely re-submit overlapping block ranges. Rows must carry every
+        required field: SQLite's INSERT OR IGNORE also drops NOT NULL failures.
+        
+        Args:
+            rows: Iterable of dicts of Transaction field values
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            List of Transaction instances submitted for insert
+        """
+        transactions = [cls(**row) for row in rows]
+        return cls.objects.bulk_create(
+            transactions,
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
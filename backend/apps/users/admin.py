@@ -21,7 +21,12 @@ class UserAdmin(BaseUserAdmin):
     ]
     search_fields = ['email', 'full_name', 'phone', 'referral_code']
     ordering = ['-created_at']
-    readonly_fields = ['id', 'referral_code', 'created_at', 'updated_at', 'last_login']
+    # The referral tree is placed once on insert (User.save), so the
+    # referrer cannot be changed afterwards without leaving it stale
+    readonly_fields = [
+        'id', 'referral_code', 'referred_by', 'referral_root', 'referral_depth',
+        'created_at', 'updated_at', 'last_login'
+    ]
     
     fieldsets = (
         (None, {
@@ -34,7 +39,7 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('kyc_tier', 'kyc_status', 'kyc_verified_at')
         }),
         (_('Referral'), {
-            'fields': ('referral_code', 'referred_by')
+            'fields': ('referral_code', 'referred_by', 'referral_root', 'referral_depth')
         }),
         (_('Security'), {
             'fields': ('email_verified', 'phone_verified', 'two_factor_enabled')
@@ -69,11 +74,14 @@ class TokenBlacklistAdmin(admin.ModelAdmin):
     list_display = ['user', 'token_type', 'blacklisted_at', 'expires_at', 'reason']
     list_filter = ['token_type', 'blacklisted_at']
     search_fields = ['user__email', 'reason']
-    readonly_fields = ['id', 'user', 'token', 'token_type', 'blacklisted_at']
+    readonly_fields = ['id', 'user', 'token_type', 'blacklisted_at']
     ordering = ['-blacklisted_at']
     
     def has_add_permission(self, request):
         return False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
 
 
 @admin.register(EmailVerificationToken)
@@ -86,12 +94,15 @@ class EmailVerificationTokenAdmin(admin.ModelAdmin):
     readonly_fields = ['id', 'user', 'token', 'created_at', 'used_at']
     ordering = ['-created_at']
     
+    @admin.display(description='Token')
     def token_preview(self, obj):
         return f"{obj.token[:16]}..."
-    token_preview.short_description = 'Token'
     
     def has_add_permission(self, request):
         return False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
 
 
 @admin.register(PasswordResetToken)
@@ -104,9 +115,12 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     readonly_fields = ['id', 'user', 'token', 'created_at', 'used_at', 'ip_address']
     ordering = ['-created_at']
     
+    @admin.display(description='Token')
     def token_preview(self, obj):
         return f"{obj.token[:16]}..."
-    token_preview.short_description = 'Token'
     
     def has_add_permission(self, request):
         return False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user')
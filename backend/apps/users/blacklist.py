@@ -0,0 +1,93 @@
+"""
+JWT revocation list
+
+Revocation checks run on every authenticated request, so with a
+Redis-backed cache (REDIS_CACHE_URL) they read the shared cache instead of
+the TokenBlacklist table; entries expire together with the token they
+revoke. Without Redis the default cache is per-process, so a revocation
+made in one worker would be invisible to the others and lost on restart;
+checks then read the TokenBlacklist table, which is written on every
+revocation either way.
+"""
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+CACHE_KEY_PREFIX = "bl"
+
+
+def _cache_key(token: str, payload: dict) -> str:
+    """Key on the jti claim; tokens issued without one fall back to a digest."""
+    jti = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{jti}"
+
+
+def _shared_cache() -> bool:
+    """Whether the default cache is Redis, shared by every process."""
+    return settings.CACHES['default']['BACKEND'].startswith('django_redis.')
+
+
+def _revoked_in_database(token: str) -> bool:
+    from apps.users.models import TokenBlacklist
+    return TokenBlacklist.objects.filter(token_sha256=TokenBlacklist.hash_token(token)).exists()
+
+
+def is_token_revoked(token: str, payload: dict) -> bool:
+    """
+    Check whether a decoded token has been revoked
+
+    Args:
+        token: Encoded JWT
+        payload: Claims returned by decode_token
+
+    Returns:
+        True if the token is on the revocation list
+    """
+    if not _shared_cache():
+        return _revoked_in_database(token)
+    return cache.get(_cache_key(token, payload)) is not None
+
+
+async def ais_token_revoked(token: str, payload: dict) -> bool:
+    """Async variant of is_token_revoked, for FastAPI dependencies and routes"""
+    if not _shared_cache():
+        return await sync_to_async(_revoked_in_database)(token)
+    return await cache.aget(_cache_key(token, payload)) is not None
+
+
+def revoke_token(token: str, payload: dict, reason: str = "") -> Optional[int]:
+    """
+    Add a decoded token to the revocation list until it expires
+
+    Args:
+        token: Encoded JWT
+        payload: Claims returned by decode_token
+        reason: Short note stored on the audit record
+
+    Returns:
+        Seconds until the entry expires, or None if the token already has
+    """
+    ttl = int(payload.get("exp", 0) - time.time())
+    if ttl <= 0:
+        return None
+
+    if _shared_cache():
+        cache.set(_cache_key(token, payload), 1, timeout=ttl)
+
+    # Read by revocation checks only when there is no shared cache
+    from apps.users.models import TokenBlacklist
+    TokenBlacklist.objects.get_or_create(
+        token_sha256=TokenBlacklist.hash_token(token),
+        defaults={
+            'user_id': payload.get("sub"),
+            'token_type': payload.get("type", "access"),
+            'expires_at': datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+            'reason': reason,
+        },
+    )
+    return ttl
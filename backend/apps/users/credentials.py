@@ -0,0 +1,86 @@
+"""
+Short-lived per-process cache of login credentials
+
+Repeated login attempts for the same email (client retries, credential
+stuffing) are answered from memory instead of re-selecting the user row.
+Entries live for CREDENTIALS_TTL seconds and are dropped when the user is
+saved in this process. Only rejections rely on a cached entry: a login
+that succeeds against one is confirmed with credentials_current, since
+another worker or a bulk UPDATE may have changed the row since.
+"""
+import threading
+import time
+from typing import NamedTuple, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+
+from apps.users import prepared
+
+CREDENTIALS_TTL = 5.0
+CREDENTIALS_MAXSIZE = 10_000
+
+
+class Credentials(NamedTuple):
+    user_id: object
+    password: str
+    is_active: bool
+
+
+_cache: dict = {}
+_lock = threading.Lock()
+
+
+def lookup_credentials(email: str) -> Tuple[Optional[Credentials], bool]:
+    """
+    Return the stored credentials for email, or None if no user has it
+
+    Misses are cached as well, so unknown emails also skip the database.
+
+    Returns:
+        (credentials, cached), where cached is True if the answer came
+        from memory rather than the database
+    """
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(email)
+    if entry is not None and entry[0] > now:
+        return entry[1], True
+
+    row = prepared.fetch_one('auth_credentials', (email,), lambda: (
+        get_user_model().objects
+        .filter(email=email)
+        .values_list('pk', 'password', 'is_active')
+        .first()
+    ))
+    credentials = Credentials(*row) if row else None
+
+    with _lock:
+        _cache.pop(email, None)
+        _evict(now)
+        _cache[email] = (now + CREDENTIALS_TTL, credentials)
+    return credentials, False
+
+
+def credentials_current(credentials: Credentials) -> bool:
+    """Whether the user row still has this password hash and is active."""
+    return get_user_model().objects.filter(
+        pk=credentials.user_id,
+        password=credentials.password,
+        is_active=True,
+    ).exists()
+
+
+def _evict(now: float) -> None:
+    """Drop expired entries, then the oldest ones until there is room; hold _lock."""
+    # Every entry has the same TTL, so insertion order is expiry order
+    while _cache:
+        email, (expires, _) = next(iter(_cache.items()))
+        if expires > now and len(_cache) < CREDENTIALS_MAXSIZE:
+            break
+        del _cache[email]
+
+
+def forget_credentials(email: str) -> None:
+    """Drop any cached credentials for email."""
+    with _lock:
+        _cache.pop(email, None)
@@ -0,0 +1,69 @@
+"""
+Coalesced last_login writes
+
+Logins record their timestamp in a Redis hash instead of updating the
+users row on every authentication; a periodic task writes the newest
+timestamp per user back in one bulk UPDATE. Without a Redis-backed
+cache there is nothing shared to buffer in, so logins write through.
+"""
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+PENDING_KEY = "last_login_pending"
+
+
+def _redis():
+    """Raw Redis client behind the default cache, or None for other backends."""
+    if not settings.CACHES['default']['BACKEND'].startswith('django_redis.'):
+        return None
+    return get_redis_connection('default')
+
+
+def record_login(user_id, when: datetime) -> None:
+    """
+    Record a successful login for user_id at when
+
+    Args:
+        user_id: Primary key of the authenticated user
+        when: Login timestamp
+    """
+    client = _redis()
+    if client is None:
+        get_user_model().objects.filter(pk=user_id).update(last_login=when)
+        return
+    client.hset(cache.make_key(PENDING_KEY), str(user_id), when.isoformat())
+
+
+def flush_pending_logins(batch_size: int = 500) -> int:
+    """
+    Write buffered login timestamps to the users table
+
+    The hash is read and cleared in one MULTI so logins recorded during
+    the flush land in the next one.
+
+    Returns:
+        Number of users updated
+    """
+    client = _redis()
+    if client is None:
+        return 0
+
+    key = cache.make_key(PENDING_KEY)
+    pipe = client.pipeline(transaction=True)
+    pipe.hgetall(key)
+    pipe.delete(key)
+    pending, _ = pipe.execute()
+    if not pending:
+        return 0
+
+    User = get_user_model()
+    users = [
+        User(pk=user_id.decode(), last_login=datetime.fromisoformat(when.decode()))
+        for user_id, when in pending.items()
+    ]
+    User.objects.bulk_update(users, ['last_login'], batch_size=batch_size)
+    return len(users)
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="emailverificationtoken",
+            name="users_email_token_c6eae7_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="passwordresettoken",
+            name="users_passw_token_b56ca3_idx",
+        ),
+        migrations.AddIndex(
+            model_name="emailverificationtoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["token"],
+                include=("user", "expires_at"),
+                name="evt_token_active_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)),
+                fields=["token"],
+                include=("user", "expires_at"),
+                name="prt_token_active_idx",
+            ),
+        ),
+    ]
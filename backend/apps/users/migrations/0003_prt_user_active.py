@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_partial_covering_token_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="passwordresettoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)), fields=["user"], name="prt_user_active"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:28
+
+import core.identifiers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_prt_user_active"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailverificationtoken",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="passwordresettoken",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tokenblacklist",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="id",
+            field=models.UUIDField(
+                default=core.identifiers.uuid7, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
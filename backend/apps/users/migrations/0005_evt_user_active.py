@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_uuid7_ids"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailverificationtoken",
+            index=models.Index(
+                condition=models.Q(("is_used", False)), fields=["user"], name="evt_user_active"
+            ),
+        ),
+    ]
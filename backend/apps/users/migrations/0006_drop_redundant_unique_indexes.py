@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:33
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_evt_user_active"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="user",
+            name="users_user_email_6f2530_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="user",
+            name="users_user_phone_9474e8_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="user",
+            name="users_user_referra_cff1f2_idx",
+        ),
+    ]
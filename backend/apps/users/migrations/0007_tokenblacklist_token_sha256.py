@@ -0,0 +1,46 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_token_sha256(apps, schema_editor):
+    TokenBlacklist = apps.get_model("users", "TokenBlacklist")
+    entries = list(TokenBlacklist.objects.only("id", "token"))
+    for entry in entries:
+        entry.token_sha256 = hashlib.sha256(entry.token.encode()).digest()
+    TokenBlacklist.objects.bulk_update(entries, ["token_sha256"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_drop_redundant_unique_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tokenblacklist",
+            name="token_sha256",
+            field=models.BinaryField(editable=False, max_length=32, null=True),
+        ),
+        migrations.RunPython(backfill_token_sha256, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tokenblacklist",
+            name="token_sha256",
+            field=models.BinaryField(
+                editable=False,
+                help_text="SHA-256 of the revoked JWT; the token itself is not stored",
+                max_length=32,
+                unique=True,
+                verbose_name="token hash",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="tokenblacklist",
+            name="users_token_token_81995b_idx",
+        ),
+        migrations.RemoveField(
+            model_name="tokenblacklist",
+            name="token",
+        ),
+    ]
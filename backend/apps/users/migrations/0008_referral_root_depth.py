@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_referral_tree(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    parents = dict(User.objects.filter(referred_by__isnull=False).values_list("id", "referred_by_id"))
+
+    placed = {}
+
+    def place(user_id):
+        # Walk up to the first placed ancestor or the root, then fill in on the way down
+        chain = []
+        while user_id in parents and user_id not in placed and user_id not in chain:
+            chain.append(user_id)
+            user_id = parents[user_id]
+        root_id, depth = placed.get(user_id, (user_id, 0))
+        for child_id in reversed(chain):
+            depth += 1
+            placed[child_id] = (root_id, depth)
+
+    for user_id in parents:
+        place(user_id)
+
+    users = [
+        User(id=user_id, referral_root_id=root_id, referral_depth=depth)
+        for user_id, (root_id, depth) in placed.items()
+    ]
+    User.objects.bulk_update(users, ["referral_root_id", "referral_depth"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0007_tokenblacklist_token_sha256"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="referral_depth",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="referral depth"
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="referral_root",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="referral root",
+            ),
+        ),
+        migrations.RunPython(backfill_referral_tree, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["referral_root", "referral_depth"], name="users_user_referra_e922f7_idx"
+            ),
+        ),
+    ]
@@ -1,17 +1,34 @@
 """
 User Models - Custom User with KYC and Web3 features
 """
-import uuid
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import RegexValidator
+import hashlib
 import secrets
+from types import MappingProxyType
+
+from core.identifiers import uuid7
+
+# Per-KYC-tier limits, shared read-only by every User instance
+_TRANSACTION_LIMITS = MappingProxyType({
+    0: MappingProxyType({'daily': 10_000, 'monthly': 50_000}),
+    1: MappingProxyType({'daily': 100_000, 'monthly': 500_000}),
+    2: MappingProxyType({'daily': 1_000_000, 'monthly': 5_000_000}),
+    3: MappingProxyType({'daily': -1, 'monthly': -1}),  # Unlimited
+})
+_GAS_MULTIPLIERS = MappingProxyType({0: 1, 1: 1, 2: 2, 3: 3})
 
 
 class UserManager(BaseUserManager):
     """Custom user manager for email/phone authentication"""
     
+    # Inserts tried before a referral code clash is treated as a real error
+    REFERRAL_CODE_ATTEMPTS = 3
+    
     def create_user(self, email, password=None, **extra_fields):
         """Create and save a regular user"""
         if not email:
@@ -19,8 +36,18 @@ class UserManager(BaseUserManager):
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
-        user.save(using=self._db)
-        return user
+        
+        # The unique index arbitrates referral codes; regenerate on the rare clash
+        for attempt in range(self.REFERRAL_CODE_ATTEMPTS):
+            try:
+                with transaction.atomic(using=self._db):
+                    user.save(using=self._db)
+                return user
+            except IntegrityError:
+                clashed = self.model.objects.filter(referral_code=user.referral_code).exists()
+                if not clashed or attempt == self.REFERRAL_CODE_ATTEMPTS - 1:
+                    raise
+                user.referral_code = self.model.generate_referral_code()
     
     def create_superuser(self, email, password=None, **extra_fields):
         """Create and save a superuser"""
@@ -56,7 +83,8 @@ class User(AbstractUser):
         SUSPENDED = 'suspended', _('Suspended')
     
     # Primary fields
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered ids keep PK/FK index inserts on the rightmost B-tree page
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(_('email address'), unique=True, db_index=True)
     username = models.CharField(
         _('username'),
@@ -119,6 +147,19 @@ class User(AbstractUser):
         related_name='referrals',
         verbose_name=_('referred by')
     )
+    # Denormalized from the referred_by chain on insert, so a whole referral
+    # tree is one indexed SELECT instead of a walk up referred_by
+    referral_root = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=False,
+        related_name='+',
+        verbose_name=_('referral root')
+    )
+    referral_depth = models.PositiveSmallIntegerField(_('referral depth'), default=0, editable=False)
     
     # Security
     email_verified = models.BooleanField(_('email verified'), default=False)
@@ -160,32 +201,46 @@ class User(AbstractUser):
         verbose_name = _('user')
         verbose_name_plural = _('users')
         ordering = ['-created_at']
+        # email, phone and referral_code are served by their unique indexes
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['phone']),
             models.Index(fields=['kyc_tier', 'kyc_status']),
-            models.Index(fields=['referral_code']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['referral_root', 'referral_depth']),
         ]
     
     def __str__(self):
         return self.email
     
     def save(self, *args, **kwargs):
-        """Generate referral code on creation"""
+        """Generate referral code and place the user in its referral tree on creation"""
         if not self.referral_code:
             self.referral_code = self.generate_referral_code()
+        if self._state.adding and self.referred_by_id and self.referral_root_id is None:
+            root_id, depth = type(self).objects.filter(pk=self.referred_by_id).values_list(
+                'referral_root_id', 'referral_depth'
+            ).get()
+            self.referral_root_id = root_id or self.referred_by_id
+            self.referral_depth = depth + 1
         if not self.username:
-            self.username = self.email.split('@')[0] + str(uuid.uuid4())[:8]
+            local = self.email.partition('@')[0]
+            self.username = f"{local}{secrets.token_hex(4)}"
         super().save(*args, **kwargs)
     
+    def referral_network(self):
+        """
+        Every user below the root of the referral tree this user belongs to,
+        shallowest first
+
+        For a referred user this is the whole tree under its root, siblings
+        and the user itself included, not only the users it referred.
+        """
+        root_id = self.referral_root_id or self.pk
+        return type(self).objects.filter(referral_root_id=root_id).order_by('referral_depth')
+    
     @staticmethod
     def generate_referral_code():
-        """Generate unique 8-character referral code"""
-        while True:
-            code = secrets.token_urlsafe(6)[:8].upper()
-            if not User.objects.filter(referral_code=code).exists():
-                return code
+        """Generate a random 8-character referral code; uniqueness is enforced on insert"""
+        return secrets.token_urlsafe(6)[:8].upper()
     
     def get_full_name(self):
         """Return full name or email"""
@@ -209,31 +264,30 @@ class User(AbstractUser):
     
     def get_transaction_limits(self):
         """Get transaction limits based on KYC tier"""
-        limits = {
-            0: {'daily': 10_000, 'monthly': 50_000},
-            1: {'daily': 100_000, 'monthly': 500_000},
-            2: {'daily': 1_000_000, 'monthly': 5_000_000},
-            3: {'daily': -1, 'monthly': -1},  # Unlimited
-        }
-        return limits.get(self.kyc_tier, limits[0])
+        return _TRANSACTION_LIMITS.get(self.kyc_tier, _TRANSACTION_LIMITS[0])
     
     def get_gas_multiplier(self):
         """Get gas sponsorship multiplier based on KYC tier"""
-        multipliers = {0: 1, 1: 1, 2: 2, 3: 3}
-        return multipliers.get(self.kyc_tier, 1)
+        return _GAS_MULTIPLIERS.get(self.kyc_tier, 1)
 
 
 class TokenBlacklist(models.Model):
     """Blacklisted JWT tokens for logout"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name='blacklisted_tokens',
         verbose_name=_('user')
     )
-    token = models.TextField(_('token'), unique=True, db_index=True)
+    token_sha256 = models.BinaryField(
+        _('token hash'),
+        max_length=32,
+        unique=True,
+        editable=False,
+        help_text=_('SHA-256 of the revoked JWT; the token itself is not stored')
+    )
     token_type = models.CharField(
         _('token type'),
         max_length=20,
@@ -249,18 +303,79 @@ class TokenBlacklist(models.Model):
         verbose_name_plural = _('token blacklists')
         ordering = ['-blacklisted_at']
         indexes = [
-            models.Index(fields=['token']),
             models.Index(fields=['user', '-blacklisted_at']),
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.token_type} - {self.blacklisted_at}"
+    
+    @staticmethod
+    def hash_token(token):
+        """Lookup key for an encoded JWT"""
+        return hashlib.sha256(token.encode()).digest()
+
+
+def _redeem_token(model, token, user_updates):
+    """
+    Mark an unused, unexpired token as used and apply user_updates to its owner
+    
+    user_updates is a dict of User field values, or a callable returning one.
+    A callable runs only once the token is claimed, so costly values such as
+    password hashes are never computed for invalid tokens.
+    
+    On PostgreSQL a dict is applied in the same statement that claims the
+    token (a data-modifying CTE); otherwise the token is claimed and the user
+    updated in one transaction. Queryset updates skip post_save, so callers
+    handle any cache invalidation.
+    
+    Returns:
+        Email of the token's user, or None if the token cannot be redeemed
+    """
+    now = timezone.now()
+    
+    if connection.vendor != 'postgresql' or callable(user_updates):
+        with transaction.atomic():
+            row = (
+                model.objects.select_for_update()
+                .filter(token=token, is_used=False, expires_at__gt=now)
+                .values_list('pk', 'user_id', 'user__email')
+                .first()
+            )
+            if row is None:
+                return None
+            pk, user_id, email = row
+            model.objects.filter(pk=pk).update(is_used=True, used_at=now)
+            if callable(user_updates):
+                user_updates = user_updates()
+            User.objects.filter(pk=user_id).update(**user_updates)
+        return email
+    
+    quote = connection.ops.quote_name
+    assignments = ", ".join(
+        f"{quote(User._meta.get_field(name).column)} = %s" for name in user_updates
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH redeemed AS (
+                UPDATE {quote(model._meta.db_table)} SET is_used = true, used_at = %s
+                WHERE token = %s AND is_used = false AND expires_at > %s
+                RETURNING user_id
+            )
+            UPDATE {quote(User._meta.db_table)} SET {assignments}
+            FROM redeemed WHERE id = redeemed.user_id
+            RETURNING email
+            """,
+            [now, token, now, *user_updates.values()],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
 
 
 class EmailVerificationToken(models.Model):
     """Email verification tokens"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -278,18 +393,35 @@ class EmailVerificationToken(models.Model):
         verbose_name_plural = _('email verification tokens')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['token']),
+            # Unused-token lookups are answered from the index alone
+            models.Index(
+                fields=['token'],
+                include=['user', 'expires_at'],
+                condition=Q(is_used=False),
+                name='evt_token_active_idx',
+            ),
+            # Resending a verification invalidates only the user's live tokens
+            models.Index(
+                fields=['user'],
+                condition=Q(is_used=False),
+                name='evt_user_active',
+            ),
             models.Index(fields=['user', '-created_at']),
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.token[:8]}..."
+    
+    @classmethod
+    def redeem(cls, token):
+        """Use a verification token and mark its user's email verified"""
+        return _redeem_token(cls, token, {'email_verified': True})
 
 
 class PasswordResetToken(models.Model):
     """Password reset tokens"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -308,9 +440,68 @@ class PasswordResetToken(models.Model):
         verbose_name_plural = _('password reset tokens')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['token']),
+            # Unused-token lookups are answered from the index alone
+            models.Index(
+                fields=['token'],
+                include=['user', 'expires_at'],
+                condition=Q(is_used=False),
+                name='prt_token_active_idx',
+            ),
+            # Invalidation on a new request touches only the user's live tokens
+            models.Index(
+                fields=['user'],
+                condition=Q(is_used=False),
+                name='prt_user_active',
+            ),
             models.Index(fields=['user', '-created_at']),
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.token[:8]}..."
+    
+    @classmethod
+    def redeem(cls, token, make_password_hash):
+        """
+        Use a reset token and store a new password hash for its user
+        
+        make_password_hash is called only after the token is claimed, so
+        requests with invalid tokens never pay for a hash.
+        """
+        return _redeem_token(cls, token, lambda: {'password': make_password_hash()})
+    
+    @classmethod
+    def issue(cls, user, token, expires_at):
+        """
+        Invalidate the user's unused reset tokens and store a new one
+        
+        On PostgreSQL both writes go out as one statement (a data-modifying
+        CTE); other backends run the UPDATE and INSERT in one transaction.
+        
+        Returns:
+            The new PasswordResetToken
+        """
+        now = timezone.now()
+        reset_token = cls(user=user, token=token, expires_at=expires_at, created_at=now)
+        
+        if connection.vendor != 'postgresql':
+            with transaction.atomic():
+                cls.objects.filter(user=user, is_used=False).update(is_used=True, used_at=now)
+                reset_token.save()
+            return reset_token
+        
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH invalidated AS (
+                    UPDATE {table} SET is_used = true, used_at = %s
+                    WHERE user_id = %s AND is_used = false
+                )
+                INSERT INTO {table} (id, user_id, token, created_at, expires_at, is_used)
+                VALUES (%s, %s, %s, %s, %s, false)
+                """,
+                [now, user.pk, reset_token.pk, user.pk, token, now, expires_at],
+            )
+        reset_token._state.adding = False
+        reset_token._state.db = connection.alias
+        return reset_token
@@ -0,0 +1,97 @@
+"""
+Server-side prepared statements for the hot login queries
+
+Each PostgreSQL connection PREPAREs a statement the first time it is
+used, so later login lookups on that connection skip the parse and plan
+steps. Other backends, deployments that turn off AUTH_PREPARED_STATEMENTS,
+and connections where PREPARE or EXECUTE fails (no users table yet, a
+transaction-pooling pgbouncer) go through the ORM fallback instead.
+"""
+import logging
+from contextlib import nullcontext
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, transaction
+from django.db import connection as default_connection
+
+logger = logging.getLogger(__name__)
+
+
+def _statements(connection) -> dict:
+    """Statement name -> SQL, built from the User model's table and columns"""
+    User = get_user_model()
+    quote = connection.ops.quote_name
+    table = quote(User._meta.db_table)
+
+    def column(name):
+        return quote(User._meta.get_field(name).column)
+
+    return {
+        'auth_credentials': (
+            f"SELECT {column('id')}, {column('password')}, {column('is_active')} "
+            f"FROM {table} WHERE {column('email')} = $1"
+        ),
+        'auth_referrer': f"SELECT {column('id')} FROM {table} WHERE {column('referral_code')} = $1",
+    }
+
+
+def is_enabled(connection=default_connection) -> bool:
+    """Whether lookups on connection should try the prepared statements"""
+    return connection.vendor == 'postgresql' and settings.AUTH_PREPARED_STATEMENTS
+
+
+def _prepared_names(connection) -> Optional[set]:
+    """
+    Names already PREPAREd on the current database session
+
+    Returns:
+        The mutable set for this session, or None once a failure has
+        disabled prepared statements on it
+    """
+    raw = connection.connection
+    state = getattr(connection, '_auth_prepared', None)
+    if state is None or state[0] is not raw:
+        # New session after a reconnect: nothing is prepared on it yet
+        state = (raw, set())
+        connection._auth_prepared = state
+    return state[1]
+
+
+def fetch_one(name: str, params: tuple, fallback: Callable[[], Optional[tuple]]) -> Optional[tuple]:
+    """
+    EXECUTE a prepared statement on the default connection
+
+    Args:
+        name: Statement name from _statements
+        params: Statement parameters
+        fallback: ORM query returning the same row, used when prepared
+            statements are off or fail on this connection
+
+    Returns:
+        First result row, or None
+    """
+    connection = default_connection
+    if not is_enabled(connection):
+        return fallback()
+
+    connection.ensure_connection()
+    names = _prepared_names(connection)
+    if names is None:
+        return fallback()
+
+    placeholders = ", ".join(["%s"] * len(params))
+    # Inside a transaction a failed statement would abort it; isolate it
+    isolate = transaction.atomic() if connection.in_atomic_block else nullcontext()
+    try:
+        with isolate, connection.cursor() as cursor:
+            if name not in names:
+                cursor.execute(f"PREPARE {name} AS {_statements(connection)[name]}")
+                names.add(name)
+            cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+            return cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Prepared statement %s failed; using the ORM on this connection", name, exc_info=True)
+        connection._auth_prepared = (connection.connection, None)
+        return fallback()
@@ -1,12 +1,17 @@
 """
 Business logic services for user management
 """
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 from datetime import datetime, timedelta
 from django.contrib.auth import get_user_model
-from django.db import transaction
+from django.contrib.auth.hashers import check_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from apps.users import prepared
+from apps.users.credentials import credentials_current, forget_credentials, lookup_credentials
+from apps.users.last_login import record_login
 from core.security import (
     hash_password,
     verify_password,
@@ -47,76 +52,124 @@ class UserService:
         if not is_valid:
             raise ValueError(error_msg)
         
-        # Check if email already exists
-        if User.objects.filter(email=email).exists():
-            raise ValueError("Email already registered")
-        
-        # Check if phone number already exists (field name is 'phone')
-        if phone_number and User.objects.filter(phone=phone_number).exists():
-            raise ValueError("Phone number already registered")
-        
         # Handle referral code
-        referred_by_user = None
+        referred_by_id = None
         if referral_code:
-            try:
-                referred_by_user = User.objects.get(referral_code=referral_code)
-            except User.DoesNotExist:
+            row = prepared.fetch_one(
+                'auth_referrer',
+                (referral_code,),
+                lambda: User.objects.filter(referral_code=referral_code).values_list('pk').first(),
+            )
+            if row is None:
                 raise ValueError("Invalid referral code")
+            referred_by_id = row[0]
         
-        # Create user
-        with transaction.atomic():
-            # Use Django's create_user which handles password hashing automatically
-            user = User.objects.create_user(
-                email=email,
-                password=password,  # Django will hash this automatically
-                phone=phone_number,  # Field name is 'phone' in the model
-                referred_by=referred_by_user
-            )
-            
-            # Create email verification token
-            from apps.users.models import EmailVerificationToken
-            token = generate_verification_token()
-            EmailVerificationToken.objects.create(
-                user=user,
-                token=token,
-                expires_at=timezone.now() + timedelta(hours=24)
-            )
-            
-            # TODO: Send verification email (will be handled by Celery task)
-            # from apps.users.tasks import send_verification_email
-            # send_verification_email.delay(user.id, token)
+        # Create user; the unique email/phone indexes reject duplicates on INSERT
+        try:
+            with transaction.atomic():
+                # Use Django's create_user which handles password hashing automatically
+                user = User.objects.create_user(
+                    email=email,
+                    password=password,  # Django will hash this automatically
+                    phone=phone_number,  # Field name is 'phone' in the model
+                    referred_by_id=referred_by_id
+                )
+        except IntegrityError:
+            conflict = UserService._registration_conflict(email, phone_number)
+            if conflict is None:
+                raise
+            raise ValueError(conflict) from None
+        
+        # Create email verification token once the user row has committed,
+        # keeping the signup transaction to one INSERT. Registered outside
+        # the try above so a failure here is never reported as a conflict;
+        # robust=True logs it instead of failing the completed signup
+        from apps.users.models import EmailVerificationToken
+        token = generate_verification_token()
+        transaction.on_commit(lambda: EmailVerificationToken.objects.create(
+            user=user,
+            token=token,
+            expires_at=timezone.now() + timedelta(hours=24)
+        ), robust=True)
+        
+        # TODO: Send verification email (will be handled by Celery task)
+        # from apps.users.tasks import send_verification_email
+        # send_verification_email.delay(user.id, token)
         
         return user, token
     
     @staticmethod
-    def authenticate_user(email: str, password: str) -> Optional[User]:
+    def _registration_conflict(email: str, phone_number: Optional[str]) -> Optional[str]:
         """
-        Authenticate user with email and password
+        Explain a failed signup INSERT with one lookup
+        
+        Returns:
+            Error message for the taken email or phone, or None if neither is
+        """
+        email = User.objects.normalize_email(email)
+        match = Q(email=email)
+        if phone_number:
+            match |= Q(phone=phone_number)
+        
+        taken = User.objects.filter(match).values_list('email', flat=True)
+        if email in taken:
+            return "Email already registered"
+        if taken:
+            return "Phone number already registered"
+        return None
+    
+    @staticmethod
+    def authenticate_credentials(email: str, password: str) -> Optional[Any]:
+        """
+        Check email and password without loading the User model
         
         Args:
             email: User email address
             password: Plain text password
             
         Returns:
-            User object if authentication successful, None otherwise
+            Primary key of the authenticated user, None otherwise
         """
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        credentials, cached = lookup_credentials(email)
+        if credentials is None or not credentials.is_active:
             return None
         
-        if not user.is_active:
+        # Verify against the cached hash
+        needs_rehash = []
+        if not check_password(password, credentials.password, setter=needs_rehash.append):
             return None
         
-        # Use Django's check_password instead of custom verify_password
-        if not user.check_password(password):
+        if cached and not credentials_current(credentials):
+            # Reset or deactivated since the entry was cached
+            forget_credentials(email)
             return None
         
-        # Update last login
-        user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        if needs_rehash:
+            # Stored hash uses an outdated hasher or cost; upgrade it
+            User.objects.filter(pk=credentials.user_id).update(password=hash_password(password))
+            forget_credentials(email)
+        
+        # Update last login (buffered in Redis and flushed by a periodic task)
+        record_login(credentials.user_id, timezone.now())
         
-        return user
+        return credentials.user_id
+    
+    @staticmethod
+    def authenticate_user(email: str, password: str) -> Optional[User]:
+        """
+        Authenticate user with email and password
+        
+        Args:
+            email: User email address
+            password: Plain text password
+            
+        Returns:
+            User object if authentication successful, None otherwise
+        """
+        user_id = UserService.authenticate_credentials(email, password)
+        if user_id is None:
+            return None
+        return User.objects.filter(pk=user_id).first()
     
     @staticmethod
     def verify_email(token: str) -> Tuple[bool, str]:
@@ -131,27 +184,12 @@ class UserService:
         """
         from apps.users.models import EmailVerificationToken
         
-        try:
-            verification = EmailVerificationToken.objects.select_related('user').get(
-                token=token,
-                is_used=False
-            )
-        except EmailVerificationToken.DoesNotExist:
+        if EmailVerificationToken.redeem(token) is None:
+            # Only failures pay for a second lookup to pick the message
+            if EmailVerificationToken.objects.filter(token=token, is_used=False).exists():
+                return False, "Verification token has expired"
             return False, "Invalid or expired verification token"
         
-        # Check if token has expired
-        if verification.expires_at < timezone.now():
-            return False, "Verification token has expired"
-        
-        # Mark email as verified
-        with transaction.atomic():
-            verification.user.email_verified = True
-            verification.user.save(update_fields=['email_verified'])
-            
-            verification.is_used = True
-            verification.used_at = timezone.now()
-            verification.save(update_fields=['is_used', 'used_at'])
-        
         return True, "Email verified successfully"
     
     @staticmethod
@@ -173,12 +211,9 @@ class UserService:
         
         from apps.users.models import PasswordResetToken
         
-        # Invalidate any existing reset tokens
-        PasswordResetToken.objects.filter(user=user, is_used=False).update(is_used=True, used_at=timezone.now())
-        
-        # Create new reset token
+        # Invalidate any existing reset tokens and create the new one
         token = generate_verification_token()
-        PasswordResetToken.objects.create(
+        PasswordResetToken.issue(
             user=user,
             token=token,
             expires_at=timezone.now() + timedelta(hours=1)
@@ -209,32 +244,15 @@ class UserService:
         if not is_valid:
             return False, error_msg
         
-        try:
-            reset_token = PasswordResetToken.objects.select_related('user').get(
-                token=token,
-                is_used=False
-            )
-        except PasswordResetToken.DoesNotExist:
+        email = PasswordResetToken.redeem(token, lambda: hash_password(new_password))
+        if email is None:
+            # Only failures pay for a second lookup to pick the message
+            if PasswordResetToken.objects.filter(token=token, is_used=False).exists():
+                return False, "Reset token has expired"
             return False, "Invalid or expired reset token"
         
-        # Check if token has expired
-        if reset_token.expires_at < timezone.now():
-            return False, "Reset token has expired"
-        
-        # Reset password
-        with transaction.atomic():
-            user = reset_token.user
-            user.password = hash_password(new_password)
-            user.save(update_fields=['password'])
-            
-            reset_token.is_used = True
-            reset_token.used_at = timezone.now()
-            reset_token.save(update_fields=['is_used', 'used_at'])
-            
-            # Invalidate all user's tokens (force re-login)
-            from apps.users.models import TokenBlacklist
-            # This would require storing all active tokens, 
-            # for now we'll just mark the reset as used
+        # The UPDATE bypasses post_save, so drop cached credentials here
+        forget_credentials(email)
         
         return True, "Password reset successfully"
     
@@ -1 +1,14 @@
-# User signals - placeholder
+"""
+User signals
+"""
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.users.credentials import forget_credentials
+
+
+@receiver(post_save, sender=get_user_model())
+def drop_cached_credentials(sender, instance, **kwargs):
+    """Password, activation and email changes must not be served from cache"""
+    forget_credentials(instance.email)
@@ -0,0 +1,49 @@
+"""Celery tasks for user account housekeeping."""
+
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.users.last_login import flush_pending_logins
+from apps.users.models import EmailVerificationToken, PasswordResetToken
+
+logger = logging.getLogger(__name__)
+
+# Used or expired tokens are kept this long for support lookups
+TOKEN_RETENTION = timedelta(days=7)
+
+
+@shared_task(name='apps.users.tasks.flush_last_login')
+def flush_last_login() -> dict:
+    """Write buffered last_login timestamps back to the users table."""
+    updated = flush_pending_logins()
+    if updated:
+        logger.info("🕒 Flushed last_login for %s users", updated)
+    return {'updated': updated}
+
+
+def _purge_stale_tokens(model, cutoff, batch_size):
+    """Delete used or expired tokens older than cutoff in primary-key batches."""
+    stale = model.objects.filter(Q(is_used=True, used_at__lt=cutoff) | Q(expires_at__lt=cutoff))
+    deleted = 0
+    while True:
+        batch = list(stale.values_list('pk', flat=True)[:batch_size])
+        if not batch:
+            return deleted
+        count, _ = model.objects.filter(pk__in=batch).delete()
+        deleted += count
+
+
+@shared_task(name='apps.users.tasks.cleanup_expired_tokens')
+def cleanup_expired_tokens(batch_size: int = 10_000) -> dict:
+    """Delete email verification and password reset tokens past retention."""
+    cutoff = timezone.now() - TOKEN_RETENTION
+    result = {
+        'email_verification': _purge_stale_tokens(EmailVerificationToken, cutoff, batch_size),
+        'password_reset': _purge_stale_tokens(PasswordResetToken, cutoff, batch_size),
+    }
+    logger.info("🧹 Purged stale auth tokens: %s", result)
+    return result
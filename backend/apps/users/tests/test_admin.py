@@ -0,0 +1,21 @@
+"""
+Tests for the users admin
+"""
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+User = get_user_model()
+
+
+class TestReferralFields:
+    """Test UserAdmin referral fields"""
+
+    def test_referrer_is_read_only(self, admin_client):
+        """The change form shows the referrer but does not edit it"""
+        root = User.objects.create_user(email="root@example.com", password="TestPass123!")
+        user = User.objects.create_user(email="child@example.com", password="TestPass123!", referred_by=root)
+
+        response = admin_client.get(reverse("admin:users_user_change", args=[user.pk]))
+
+        assert response.status_code == 200
+        assert "referred_by" not in response.context["adminform"].form.fields
@@ -0,0 +1,64 @@
+"""
+Tests for the token revocation list
+"""
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+
+from apps.users import blacklist
+from apps.users.blacklist import ais_token_revoked, is_token_revoked, revoke_token
+from apps.users.models import TokenBlacklist
+from core.security import create_access_token, decode_token
+
+User = get_user_model()
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """Swap the dummy test cache for one that keeps entries"""
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email="revoke@example.com", password="TestPass123!")
+
+
+class TestRevokeToken:
+    """Test revoke_token / is_token_revoked"""
+
+    def test_revoked_token_is_rejected(self, locmem_cache, user):
+        """A revoked token is flagged and audited; fresh tokens are not"""
+        token = create_access_token(data={"sub": str(user.id)})
+        other = create_access_token(data={"sub": str(user.id)})
+        payload = decode_token(token)
+
+        assert revoke_token(token, payload, reason="logout") > 0
+
+        assert is_token_revoked(token, payload)
+        assert not is_token_revoked(other, decode_token(other))
+        assert TokenBlacklist.objects.filter(user=user, reason="logout").count() == 1
+        assert TokenBlacklist.objects.filter(token_sha256=TokenBlacklist.hash_token(token)).exists()
+
+    def test_revocation_without_shared_cache_reads_database(self, locmem_cache, user):
+        """Per-process caches are not trusted; every worker sees the table"""
+        token = create_access_token(data={"sub": str(user.id)})
+        payload = decode_token(token)
+        revoke_token(token, payload)
+
+        blacklist.cache.clear()
+
+        assert is_token_revoked(token, payload)
+        assert async_to_sync(ais_token_revoked)(token, payload)
+
+    def test_shared_cache_answers_without_database(self, locmem_cache, user, monkeypatch, django_assert_num_queries):
+        """With Redis as the cache, checks never touch the table"""
+        monkeypatch.setattr(blacklist, "_shared_cache", lambda: True)
+        token = create_access_token(data={"sub": str(user.id)})
+        payload = decode_token(token)
+        revoke_token(token, payload)
+
+        with django_assert_num_queries(0):
+            assert is_token_revoked(token, payload)
@@ -0,0 +1,204 @@
+"""
+Tests for user models and services
+"""
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.users import credentials, prepared
+from apps.users.models import EmailVerificationToken, PasswordResetToken
+from apps.users.services import UserService
+
+User = get_user_model()
+
+
+class TestCreateUser:
+    """Test UserManager.create_user"""
+
+    def test_regenerates_clashing_referral_code(self, db, monkeypatch):
+        """A referral code already taken is replaced instead of failing signup"""
+        first = User.objects.create_user(email="first@example.com", password="TestPass123!")
+        codes = iter([first.referral_code, "FRESH123"])
+        monkeypatch.setattr(User, "generate_referral_code", staticmethod(lambda: next(codes)))
+
+        second = User.objects.create_user(email="second@example.com", password="TestPass123!")
+
+        assert second.referral_code == "FRESH123"
+        assert User.objects.count() == 2
+
+    def test_referral_tree_is_denormalized(self, db):
+        """Referred users record their tree root and depth on creation"""
+        root = User.objects.create_user(email="root@example.com", password="TestPass123!")
+        child = User.objects.create_user(email="child@example.com", password="TestPass123!", referred_by=root)
+        grandchild = User.objects.create_user(
+            email="grandchild@example.com", password="TestPass123!", referred_by=child
+        )
+
+        assert (grandchild.referral_root_id, grandchild.referral_depth) == (root.pk, 2)
+        assert list(root.referral_network()) == [child, grandchild]
+        assert list(child.referral_network()) == [child, grandchild]
+
+
+class TestRegisterUser:
+    """Test UserService.create_user"""
+
+    def test_duplicate_email_and_phone_are_reported(self, db):
+        """The unique indexes reject duplicates with the usual messages"""
+        UserService.create_user("taken@example.com", "TestPass123!", phone_number="+2348000000000")
+
+        with pytest.raises(ValueError, match="Email already registered"):
+            UserService.create_user("taken@example.com", "TestPass123!")
+        with pytest.raises(ValueError, match="Phone number already registered"):
+            UserService.create_user("other@example.com", "TestPass123!", phone_number="+2348000000000")
+
+    def test_referral_code_links_referrer(self, db):
+        """A known referral code sets referred_by; an unknown one is rejected"""
+        referrer = User.objects.create_user(email="referrer@example.com", password="TestPass123!")
+
+        user, _ = UserService.create_user("friend@example.com", "TestPass123!", referral_code=referrer.referral_code)
+
+        assert user.referred_by_id == referrer.pk
+        with pytest.raises(ValueError, match="Invalid referral code"):
+            UserService.create_user("stranger@example.com", "TestPass123!", referral_code="NOPE0000")
+
+    def test_verification_token_written_after_commit(self, db, django_capture_on_commit_callbacks):
+        """The verification token is stored once the user row commits"""
+        with django_capture_on_commit_callbacks(execute=True):
+            user, token = UserService.create_user(email="new@example.com", password="TestPass123!")
+
+        assert EmailVerificationToken.objects.filter(user=user, token=token, is_used=False).exists()
+
+    def test_failed_verification_token_keeps_signup(self, db, django_capture_on_commit_callbacks, monkeypatch):
+        """A token write failure is logged, not reported as a duplicate email"""
+        def fail(**kwargs):
+            raise RuntimeError("token write failed")
+
+        monkeypatch.setattr(EmailVerificationToken.objects, "create", fail)
+        with django_capture_on_commit_callbacks(execute=True):
+            user, _ = UserService.create_user(email="kept@example.com", password="TestPass123!")
+
+        assert User.objects.filter(pk=user.pk).exists()
+
+
+class TestIssueResetToken:
+    """Test PasswordResetToken.issue"""
+
+    def test_invalidates_previous_tokens(self, db):
+        """Only the newest reset token stays usable"""
+        user = User.objects.create_user(email="reset@example.com", password="TestPass123!")
+        expires_at = timezone.now() + timedelta(hours=1)
+
+        PasswordResetToken.issue(user, "first", expires_at)
+        latest = PasswordResetToken.issue(user, "second", expires_at)
+
+        live = PasswordResetToken.objects.filter(user=user, is_used=False)
+        assert list(live.values_list('token', flat=True)) == ["second"]
+        assert latest.pk == live.get().pk
+
+
+class TestRedeemToken:
+    """Test UserService.verify_email / reset_password token redemption"""
+
+    def test_verify_email_is_single_use(self, db):
+        """A verification token marks the email verified exactly once"""
+        user = User.objects.create_user(email="verify@example.com", password="TestPass123!")
+        EmailVerificationToken.objects.create(
+            user=user, token="verify", expires_at=timezone.now() + timedelta(hours=1)
+        )
+
+        assert UserService.verify_email("verify") == (True, "Email verified successfully")
+        assert UserService.verify_email("verify") == (False, "Invalid or expired verification token")
+        user.refresh_from_db()
+        assert user.email_verified
+
+    def test_expired_reset_token_keeps_password(self, db):
+        """An expired reset token is reported and changes nothing"""
+        user = User.objects.create_user(email="expired@example.com", password="TestPass123!")
+        PasswordResetToken.objects.create(
+            user=user, token="stale", expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert UserService.reset_password("stale", "NewPass456!") == (False, "Reset token has expired")
+        user.refresh_from_db()
+        assert user.check_password("TestPass123!")
+
+    def test_invalid_reset_token_skips_hashing(self, db, monkeypatch):
+        """Unknown tokens are rejected before the new password is hashed"""
+        def fail(password):
+            raise AssertionError("password hashed for an invalid token")
+
+        monkeypatch.setattr("apps.users.services.hash_password", fail)
+
+        assert UserService.reset_password("bogus", "NewPass456!") == (False, "Invalid or expired reset token")
+
+    def test_reset_password_invalidates_cached_credentials(self, db):
+        """The old password stops working right after a reset"""
+        user = User.objects.create_user(email="forgot@example.com", password="TestPass123!")
+        PasswordResetToken.issue(user, "reset", timezone.now() + timedelta(hours=1))
+        assert UserService.authenticate_user("forgot@example.com", "TestPass123!") == user
+
+        assert UserService.reset_password("reset", "NewPass456!") == (True, "Password reset successfully")
+
+        assert UserService.authenticate_user("forgot@example.com", "TestPass123!") is None
+        assert UserService.authenticate_user("forgot@example.com", "NewPass456!") == user
+
+
+class TestAuthenticateUser:
+    """Test UserService.authenticate_user credential caching"""
+
+    def test_repeat_failures_skip_the_database(self, db, django_assert_num_queries):
+        """A retried bad password is checked against the cached hash"""
+        User.objects.create_user(email="login@example.com", password="TestPass123!")
+        assert UserService.authenticate_user("login@example.com", "wrong") is None
+
+        with django_assert_num_queries(0):
+            assert UserService.authenticate_user("login@example.com", "wrong") is None
+
+    def test_credentials_login_skips_model_hydration(self, db, django_assert_num_queries):
+        """A successful login reads one credentials row and writes last_login"""
+        user = User.objects.create_user(email="fast@example.com", password="TestPass123!")
+
+        with django_assert_num_queries(2):
+            assert UserService.authenticate_credentials("fast@example.com", "TestPass123!") == user.pk
+
+        user.refresh_from_db()
+        assert user.last_login is not None
+
+    def test_failed_prepared_statement_falls_back_to_orm(self, db, monkeypatch):
+        """A connection that cannot PREPARE still logs in, and stops trying"""
+        monkeypatch.setattr(prepared, "is_enabled", lambda connection=None: True)
+        user = User.objects.create_user(email="prep@example.com", password="TestPass123!")
+
+        assert UserService.authenticate_credentials("prep@example.com", "TestPass123!") == user.pk
+        assert prepared._prepared_names(prepared.default_connection) is None
+
+    def test_cached_login_rechecks_the_row(self, db):
+        """A bulk deactivation skips post_save but still blocks a cached login"""
+        user = User.objects.create_user(email="stale@example.com", password="TestPass123!")
+        assert UserService.authenticate_user("stale@example.com", "wrong") is None
+
+        User.objects.filter(pk=user.pk).update(is_active=False)
+
+        assert UserService.authenticate_user("stale@example.com", "TestPass123!") is None
+
+    def test_full_cache_evicts_oldest_entry(self, db, monkeypatch):
+        """Overflowing the cache drops the oldest entry instead of all of them"""
+        monkeypatch.setattr(credentials, "CREDENTIALS_MAXSIZE", 2)
+        monkeypatch.setattr(credentials, "_cache", {})
+        for email in ("a@example.com", "b@example.com", "c@example.com"):
+            credentials.lookup_credentials(email)
+
+        assert list(credentials._cache) == ["b@example.com", "c@example.com"]
+
+    def test_password_change_invalidates_cache(self, db):
+        """Saving the user drops the cached hash"""
+        user = User.objects.create_user(email="change@example.com", password="TestPass123!")
+        assert UserService.authenticate_user("change@example.com", "TestPass123!") == user
+
+        user.set_password("NewPass456!")
+        user.save()
+
+        assert UserService.authenticate_user("change@example.com", "TestPass123!") is None
+        assert UserService.authenticate_user("change@example.com", "NewPass456!") == user
@@ -0,0 +1,36 @@
+"""
+Tests for user housekeeping tasks
+"""
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from apps.users.models import EmailVerificationToken
+from apps.users.tasks import cleanup_expired_tokens
+
+User = get_user_model()
+
+
+class TestCleanupExpiredTokens:
+    """Test cleanup_expired_tokens"""
+
+    def test_keeps_live_and_recent_tokens(self, db):
+        """Only tokens past the retention window are deleted"""
+        user = User.objects.create_user(email="tokens@example.com", password="TestPass123!")
+        now = timezone.now()
+        for token, expires_at, used_at in [
+            ("live", now + timedelta(hours=1), None),
+            ("recently-used", now + timedelta(hours=1), now - timedelta(days=1)),
+            ("long-used", now + timedelta(hours=1), now - timedelta(days=30)),
+            ("long-expired", now - timedelta(days=30), None),
+        ]:
+            EmailVerificationToken.objects.create(
+                user=user, token=token, expires_at=expires_at,
+                is_used=used_at is not None, used_at=used_at,
+            )
+
+        result = cleanup_expired_tokens(batch_size=1)
+
+        assert result['email_verification'] == 2
+        assert set(EmailVerificationToken.objects.values_list('token', flat=True)) == {"live", "recently-used"}
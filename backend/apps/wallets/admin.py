@@ -1,27 +1,76 @@
 """
 Wallets Admin Configuration
 """
+import re
+
 from django.contrib import admin
+from django.db.models import Q
+
+from core.admin import ChangelistFieldsMixin
 from .models import Wallet, WalletBalance, WalletActivity
 
+# Columns Wallet.__str__ reads when a wallet is shown through a foreign key
+WALLET_STR_FIELDS = [
+    'wallet', 'wallet__user', 'wallet__user__email', 'wallet__eoa_address',
+    'wallet__smart_account_address', 'wallet__network',
+]
+
+ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+
+class AddressSearchMixin:
+    """
+    Search address columns by exact match on a full 0x address
+
+    Addresses are stored as bytes, which have no icontains lookup, so a
+    search term that is a whole address is matched against
+    address_search_fields; anything else goes through search_fields.
+    """
+
+    address_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not ADDRESS_RE.fullmatch(term):
+            return super().get_search_results(request, queryset, search_term)
+        match = Q()
+        for field in self.address_search_fields:
+            match |= Q(**{field: term})
+        return queryset.filter(match), False
+
 @admin.register(Wallet)
-class WalletAdmin(admin.ModelAdmin):
+class WalletAdmin(AddressSearchMixin, ChangelistFieldsMixin, admin.ModelAdmin):
     list_display = ['user', 'short_address', 'network', 'is_primary', 'is_smart_account_deployed', 'created_at']
     list_filter = ['network', 'chain_id', 'is_primary', 'is_smart_account_deployed', 'is_active']
-    search_fields = ['user__email', 'eoa_address', 'smart_account_address']
+    search_fields = ['user__email']
+    address_search_fields = ['eoa_address', 'smart_account_address']
     readonly_fields = ['id', 'created_at', 'updated_at']
     ordering = ['-created_at']
+    list_select_related = ['user']
+    changelist_fields = [
+        'id', 'user', 'user__email', 'eoa_address', 'smart_account_address',
+        'network', 'is_primary', 'is_smart_account_deployed', 'created_at',
+    ]
 
 @admin.register(WalletBalance)
-class WalletBalanceAdmin(admin.ModelAdmin):
+class WalletBalanceAdmin(AddressSearchMixin, ChangelistFieldsMixin, admin.ModelAdmin):
     list_display = ['wallet', 'token_symbol', 'balance', 'balance_usd', 'last_updated', 'is_stale']
     list_filter = ['token_symbol', 'is_stale']
-    search_fields = ['wallet__eoa_address', 'token_symbol']
+    search_fields = ['token_symbol']
+    address_search_fields = ['wallet__eoa_address', 'token_address']
     readonly_fields = ['id']
+    list_select_related = ['wallet__user']
+    changelist_fields = [
+        'id', 'token_symbol', 'balance', 'balance_usd', 'last_updated', 'is_stale',
+        *WALLET_STR_FIELDS,
+    ]
 
 @admin.register(WalletActivity)
-class WalletActivityAdmin(admin.ModelAdmin):
+class WalletActivityAdmin(AddressSearchMixin, ChangelistFieldsMixin, admin.ModelAdmin):
     list_display = ['wallet', 'activity_type', 'created_at', 'ip_address']
     list_filter = ['activity_type', 'created_at']
-    search_fields = ['wallet__eoa_address', 'description']
+    search_fields = ['description']
+    address_search_fields = ['wallet__eoa_address']
     readonly_fields = ['id', 'created_at']
+    list_select_related = ['wallet__user']
+    changelist_fields = ['id', 'activity_type', 'created_at', 'ip_address', *WALLET_STR_FIELDS]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:41
+
+from django.db import migrations, models
+
+
+def demote_duplicate_primaries(apps, schema_editor):
+    # Concurrent saves could leave two primaries; keep the newest per user and chain
+    Wallet = apps.get_model("wallets", "Wallet")
+    seen = set()
+    demote = []
+    primaries = Wallet.objects.filter(is_primary=True).order_by("-created_at")
+    for pk, user_id, chain_id in primaries.values_list("pk", "user_id", "chain_id"):
+        if (user_id, chain_id) in seen:
+            demote.append(pk)
+        seen.add((user_id, chain_id))
+    Wallet.objects.filter(pk__in=demote).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="wallets_wal_user_id_e48106_idx",
+        ),
+        migrations.RunPython(demote_duplicate_primaries, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="wallet",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_primary", True)),
+                fields=("user", "chain_id"),
+                name="uniq_primary_per_user_chain",
+            ),
+        ),
+    ]
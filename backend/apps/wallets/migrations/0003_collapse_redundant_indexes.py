@@ -0,0 +1,109 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0002_uniq_primary_per_user_chain"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="wallets_wal_user_id_360aca_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="wallets_wal_eoa_add_6c5d4a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="wallet",
+            name="wallets_wal_smart_a_cd41e4_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="walletbalance",
+            name="wallets_wal_wallet__71ebbf_idx",
+        ),
+        migrations.AlterUniqueTogether(
+            name="wallet",
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="chain_id",
+            field=models.IntegerField(
+                help_text="Blockchain chain ID (1=Ethereum, 8453=Base, etc.)",
+                verbose_name="chain ID",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="eoa_address",
+            field=models.CharField(
+                help_text="Externally Owned Account address (0x...)",
+                max_length=42,
+                unique=True,
+                verbose_name="EOA address",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="network",
+            field=models.CharField(
+                choices=[
+                    ("ethereum", "Ethereum"),
+                    ("base", "Base"),
+                    ("arbitrum", "Arbitrum"),
+                    ("optimism", "Optimism"),
+                    ("polygon", "Polygon"),
+                ],
+                max_length=20,
+                verbose_name="network",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="smart_account_address",
+            field=models.CharField(
+                blank=True,
+                help_text="ERC-4337 Smart Account address (0x...)",
+                max_length=42,
+                null=True,
+                unique=True,
+                verbose_name="smart account address",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="walletactivity",
+            name="activity_type",
+            field=models.CharField(
+                choices=[
+                    ("created", "Wallet Created"),
+                    ("smart_account_deployed", "Smart Account Deployed"),
+                    ("transaction", "Transaction"),
+                    ("balance_check", "Balance Check"),
+                    ("backup", "Backup Performed"),
+                ],
+                max_length=30,
+                verbose_name="activity type",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="walletbalance",
+            name="last_updated",
+            field=models.DateTimeField(auto_now=True, verbose_name="last updated"),
+        ),
+        migrations.AddIndex(
+            model_name="wallet",
+            index=models.Index(
+                fields=["user", "chain_id", "-created_at"], name="wallet_user_chain_recent"
+            ),
+        ),
+    ]
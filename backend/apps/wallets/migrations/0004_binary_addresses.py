@@ -0,0 +1,130 @@
+import re
+
+from django.db import migrations
+
+import core.fields
+
+# (model, field, byte length) moved from hex text to raw bytes
+CONVERTED = [
+    ("wallet", "eoa_address", 20),
+    ("wallet", "smart_account_address", 20),
+    ("wallet", "deployment_tx_hash", 32),
+    ("walletbalance", "token_address", 20),
+]
+
+BATCH_SIZE = 500
+
+# Legacy text may lack the 0x prefix or carry stray whitespace
+LEGACY_HEX = re.compile(r"^(?:0x)?((?:[0-9a-f]{2})+)$")
+
+
+def normalize_hex(value, byte_length):
+    """0x-prefixed lowercase hex of byte_length bytes, or None if value is not one"""
+    match = LEGACY_HEX.match(value.strip().lower())
+    if match is None or len(match.group(1)) != 2 * byte_length:
+        return None
+    return "0x" + match.group(1)
+
+
+def copy_hex_to_bytes(apps, schema_editor):
+    # The staging columns are HexBytesFields, so assigning the hex text stores bytes
+    for model_name, field_name, byte_length in CONVERTED:
+        model = apps.get_model("wallets", model_name)
+        field = model._meta.get_field(field_name)
+        staging = f"{field_name}_bytes"
+        malformed = []
+        batch = []
+        for row in model.objects.only("pk", field_name).iterator(chunk_size=BATCH_SIZE):
+            value = getattr(row, field_name)
+            if value:
+                value = normalize_hex(value, byte_length)
+                if value is None:
+                    # Unconvertible: cleared, or reported below if the column needs a value
+                    malformed.append(str(row.pk))
+                    value = None if field.null else ""
+            setattr(row, staging, value)
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                model.objects.bulk_update(batch, [staging])
+                batch = []
+        model.objects.bulk_update(batch, [staging])
+
+        if malformed and not field.blank:
+            raise ValueError(
+                f"{model_name}.{field_name} is not valid hex for rows {malformed[:20]}; "
+                "fix them before migrating"
+            )
+
+
+def stage(model_name, field_name, byte_length):
+    return migrations.AddField(
+        model_name=model_name,
+        name=f"{field_name}_bytes",
+        field=core.fields.HexBytesField(byte_length=byte_length, editable=True, null=True),
+    )
+
+
+def swap(model_name, field_name):
+    return [
+        migrations.RemoveField(model_name=model_name, name=field_name),
+        migrations.RenameField(model_name=model_name, old_name=f"{field_name}_bytes", new_name=field_name),
+    ]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0003_collapse_redundant_indexes"),
+    ]
+
+    operations = [
+        *(stage(*converted) for converted in CONVERTED),
+        migrations.RunPython(copy_hex_to_bytes, migrations.RunPython.noop),
+        *(op for model_name, field_name, _ in CONVERTED for op in swap(model_name, field_name)),
+        migrations.AlterField(
+            model_name="wallet",
+            name="deployment_tx_hash",
+            field=core.fields.HexBytesField(
+                blank=True,
+                byte_length=32,
+                editable=True,
+                help_text="Transaction hash of smart account deployment",
+                verbose_name="deployment transaction hash",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="eoa_address",
+            field=core.fields.HexBytesField(
+                byte_length=20,
+                editable=True,
+                help_text="Externally Owned Account address (0x...)",
+                unique=True,
+                verbose_name="EOA address",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="wallet",
+            name="smart_account_address",
+            field=core.fields.HexBytesField(
+                blank=True,
+                byte_length=20,
+                editable=True,
+                help_text="ERC-4337 Smart Account address (0x...)",
+                null=True,
+                unique=True,
+                verbose_name="smart account address",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="walletbalance",
+            name="token_address",
+            field=core.fields.HexBytesField(
+                blank=True,
+                byte_length=20,
+                editable=True,
+                help_text="Token contract address (empty for native token)",
+                verbose_name="token address",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0004_binary_addresses"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="walletactivity",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0005_drop_walletactivity_created_at_index"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="walletbalance",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="walletbalance",
+            constraint=models.UniqueConstraint(
+                fields=("wallet", "token_symbol"), name="uniq_wallet_token"
+            ),
+        ),
+    ]
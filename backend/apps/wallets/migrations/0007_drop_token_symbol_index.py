@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0006_walletbalance_uniq_wallet_token"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="walletbalance",
+            name="token_symbol",
+            field=models.CharField(
+                help_text="Token symbol (ETH, USDC, USDT, etc.)",
+                max_length=20,
+                verbose_name="token symbol",
+            ),
+        ),
+    ]
@@ -2,10 +2,24 @@
 Wallet Models - Multi-chain wallet management
 """
 import uuid
-from django.db import models
+from types import MappingProxyType
+
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
+from core.fields import HexBytesField
+
+# Display names for supported chain IDs, shared read-only by every Wallet
+_CHAIN_NAMES = MappingProxyType({
+    1: 'Ethereum',
+    8453: 'Base',
+    42161: 'Arbitrum',
+    10: 'Optimism',
+    137: 'Polygon',
+})
+
 
 class Wallet(models.Model):
     """
@@ -33,18 +47,16 @@ class Wallet(models.Model):
     )
     
     # Wallet addresses
-    eoa_address = models.CharField(
+    eoa_address = HexBytesField(
         _('EOA address'),
-        max_length=42,
+        byte_length=20,
         unique=True,
-        db_index=True,
         help_text=_('Externally Owned Account address (0x...)')
     )
-    smart_account_address = models.CharField(
+    smart_account_address = HexBytesField(
         _('smart account address'),
-        max_length=42,
+        byte_length=20,
         unique=True,
-        db_index=True,
         null=True,
         blank=True,
         help_text=_('ERC-4337 Smart Account address (0x...)')
@@ -53,14 +65,12 @@ class Wallet(models.Model):
     # Network configuration
     chain_id = models.IntegerField(
         _('chain ID'),
-        db_index=True,
         help_text=_('Blockchain chain ID (1=Ethereum, 8453=Base, etc.)')
     )
     network = models.CharField(
         _('network'),
         max_length=20,
-        choices=Network.choices,
-        db_index=True
+        choices=Network.choices
     )
     
     # Smart Account deployment
@@ -69,9 +79,9 @@ class Wallet(models.Model):
         default=False,
         help_text=_('Whether the smart account contract is deployed on-chain')
     )
-    deployment_tx_hash = models.CharField(
+    deployment_tx_hash = HexBytesField(
         _('deployment transaction hash'),
-        max_length=66,
+        byte_length=32,
         blank=True,
         help_text=_('Transaction hash of smart account deployment')
     )
@@ -105,7 +115,7 @@ class Wallet(models.Model):
     metadata = models.JSONField(_('metadata'), default=dict, blank=True)
     
     # Timestamps
-    created_at = models.DateTimeField(_('created at'), auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
     last_used_at = models.DateTimeField(_('last used at'), null=True, blank=True)
     
@@ -113,28 +123,51 @@ class Wallet(models.Model):
         verbose_name = _('wallet')
         verbose_name_plural = _('wallets')
         ordering = ['-is_primary', '-created_at']
-        unique_together = [['user', 'chain_id', 'eoa_address']]
+        # Both addresses are already indexed by their unique constraints
         indexes = [
-            models.Index(fields=['user', 'chain_id']),
-            models.Index(fields=['eoa_address']),
-            models.Index(fields=['smart_account_address']),
-            models.Index(fields=['user', 'is_primary']),
+            models.Index(fields=['user', 'chain_id', '-created_at'], name='wallet_user_chain_recent'),
             models.Index(fields=['-created_at']),
         ]
+        constraints = [
+            # Also serves "primary wallets of a user" lookups
+            models.UniqueConstraint(
+                fields=['user', 'chain_id'],
+                condition=Q(is_primary=True),
+                name='uniq_primary_per_user_chain',
+            ),
+        ]
     
     def __str__(self):
         wallet_type = "Smart" if self.smart_account_address else "EOA"
         return f"{self.user.email} - {wallet_type} - {self.network} ({self.eoa_address[:10]}...)"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Snapshot without triggering a load when is_primary is deferred
+        instance._loaded_is_primary = instance.__dict__.get('is_primary')
+        return instance
+    
     def save(self, *args, **kwargs):
         """Ensure only one primary wallet per user per network"""
-        if self.is_primary:
-            Wallet.objects.filter(
-                user=self.user,
-                chain_id=self.chain_id,
-                is_primary=True
-            ).exclude(id=self.id).update(is_primary=False)
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        promoted = (
+            self.is_primary
+            and (self._state.adding or not getattr(self, '_loaded_is_primary', False))
+            and (update_fields is None or 'is_primary' in update_fields)
+        )
+        if not promoted:
+            super().save(*args, **kwargs)
+        else:
+            # Demote the old primary first; the partial unique index rejects two
+            with transaction.atomic():
+                Wallet.objects.filter(
+                    user_id=self.user_id,
+                    chain_id=self.chain_id,
+                    is_primary=True
+                ).exclude(pk=self.pk).update(is_primary=False)
+                super().save(*args, **kwargs)
+        self._loaded_is_primary = self.is_primary
     
     @property
     def display_address(self):
@@ -149,14 +182,7 @@ class Wallet(models.Model):
     
     def get_chain_name(self):
         """Get human-readable chain name"""
-        chain_names = {
-            1: 'Ethereum',
-            8453: 'Base',
-            42161: 'Arbitrum',
-            10: 'Optimism',
-            137: 'Polygon',
-        }
-        return chain_names.get(self.chain_id, f'Chain {self.chain_id}')
+        return _CHAIN_NAMES.get(self.chain_id, f'Chain {self.chain_id}')
 
 
 class WalletBalance(models.Model):
@@ -176,12 +202,11 @@ class WalletBalance(models.Model):
     token_symbol = models.CharField(
         _('token symbol'),
         max_length=20,
-        db_index=True,
         help_text=_('Token symbol (ETH, USDC, USDT, etc.)')
     )
-    token_address = models.CharField(
+    token_address = HexBytesField(
         _('token address'),
-        max_length=42,
+        byte_length=20,
         blank=True,
         help_text=_('Token contract address (empty for native token)')
     )
@@ -207,7 +232,7 @@ class WalletBalance(models.Model):
     )
     
     # Cache metadata
-    last_updated = models.DateTimeField(_('last updated'), auto_now=True, db_index=True)
+    last_updated = models.DateTimeField(_('last updated'), auto_now=True)
     is_stale = models.BooleanField(
         _('is stale'),
         default=False,
@@ -217,10 +242,11 @@ class WalletBalance(models.Model):
     class Meta:
         verbose_name = _('wallet balance')
         verbose_name_plural = _('wallet balances')
-        unique_together = [['wallet', 'token_symbol']]
         ordering = ['-balance_usd']
+        constraints = [
+            models.UniqueConstraint(fields=['wallet', 'token_symbol'], name='uniq_wallet_token'),
+        ]
         indexes = [
-            models.Index(fields=['wallet', 'token_symbol']),
             models.Index(fields=['wallet', '-balance_usd']),
             models.Index(fields=['-last_updated']),
         ]
@@ -232,6 +258,32 @@ class WalletBalance(models.Model):
     def formatted_balance(self):
         """Return human-readable balance"""
         return f"{self.balance:.4f} {self.token_symbol}"
+    
+    @classmethod
+    def upsert_many(cls, rows, batch_size=500):
+        """
+        Insert or refresh many balances with multi-row upserts
+        
+        Each batch is one INSERT ... ON CONFLICT (wallet, token_symbol)
+        DO UPDATE, so refresh jobs write a wallet's whole portfolio in one
+        round trip instead of a get-then-save per token. Token metadata
+        (address, decimals) is kept from the first insert.
+        
+        Args:
+            rows: Iterable of dicts of WalletBalance field values
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            List of WalletBalance instances submitted for upsert
+        """
+        balances = [cls(**row) for row in rows]
+        return cls.objects.bulk_create(
+            balances,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['wallet', 'token_symbol'],
+            update_fields=['balance', 'balance_usd', 'last_updated', 'is_stale'],
+        )
 
 
 class WalletActivity(models.Model):
@@ -257,8 +309,7 @@ class WalletActivity(models.Model):
     activity_type = models.CharField(
         _('activity type'),
         max_length=30,
-        choices=ActivityType.choices,
-        db_index=True
+        choices=ActivityType.choices
     )
     description = models.TextField(_('description'), blank=True)
     metadata = models.JSONField(_('metadata'), default=dict, blank=True)
@@ -266,7 +317,8 @@ class WalletActivity(models.Model):
     ip_address = models.GenericIPAddressField(_('IP address'), null=True, blank=True)
     user_agent = models.TextField(_('user agent'), blank=True)
     
-    created_at = models.DateTimeField(_('created at'), auto_now_add=True, db_index=True)
+    # Read per wallet or per type through the composite indexes in Meta
+    created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     
     class Meta:
         verbose_name = _('wallet activity')
@@ -0,0 +1,88 @@
+"""
+Tests for wallet models
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from apps.wallets.models import Wallet, WalletBalance
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    """Create a user to own wallets"""
+    return User.objects.create_user(email="wallet@example.com", password="TestPass123!")
+
+
+def _wallet(user, address, **kwargs):
+    return Wallet.objects.create(
+        user=user,
+        eoa_address=address,
+        chain_id=8453,
+        network=Wallet.Network.BASE,
+        **kwargs,
+    )
+
+
+class TestPrimaryWallet:
+    """Test Wallet.save primary flag handling"""
+
+    def test_new_primary_demotes_previous(self, user):
+        """Only one wallet per user and chain stays primary"""
+        first = _wallet(user, "0x" + "1" * 40, is_primary=True)
+        second = _wallet(user, "0x" + "2" * 40, is_primary=True)
+
+        first.refresh_from_db()
+        assert not first.is_primary
+        assert list(Wallet.objects.filter(is_primary=True)) == [second]
+
+    def test_unchanged_primary_skips_demotion(self, user, django_assert_num_queries):
+        """Re-saving a loaded primary wallet issues only its own UPDATE"""
+        _wallet(user, "0x" + "1" * 40, is_primary=True)
+        wallet = Wallet.objects.get()
+        wallet.wallet_name = "Main"
+
+        with django_assert_num_queries(1):
+            wallet.save()
+
+
+class TestBinaryAddresses:
+    """Test addresses stored through HexBytesField"""
+
+    def test_round_trip_and_case_insensitive_lookup(self, user):
+        """Addresses come back as lowercase hex and match in any case"""
+        _wallet(user, "0x" + "AbCd" * 10, smart_account_address=None)
+
+        wallet = Wallet.objects.get(eoa_address="0x" + "ABCD" * 10)
+        assert wallet.eoa_address == "0x" + "abcd" * 10
+        assert wallet.smart_account_address is None
+        assert wallet.deployment_tx_hash == ""
+
+    def test_malformed_lookup_matches_nothing(self, user):
+        """Lookups with non-hex input return no rows instead of raising"""
+        _wallet(user, "0x" + "1" * 40)
+
+        assert not Wallet.objects.filter(eoa_address="not-an-address").exists()
+        assert list(Wallet.objects.filter(eoa_address__in=["bogus", "0x" + "1" * 40])) == [Wallet.objects.get()]
+        assert Wallet.objects.filter(Q(eoa_address="bogus") | Q(user=user)).count() == 1
+
+
+class TestBalanceUpsert:
+    """Test WalletBalance.upsert_many"""
+
+    def test_upsert_refreshes_existing_rows(self, user):
+        """Known tokens are updated in place and new tokens are inserted"""
+        wallet = _wallet(user, "0x" + "1" * 40)
+        WalletBalance.objects.create(wallet=wallet, token_symbol="USDC", balance=1, is_stale=True)
+
+        WalletBalance.upsert_many([
+            {"wallet": wallet, "token_symbol": "USDC", "balance": 5, "balance_usd": 5},
+            {"wallet": wallet, "token_symbol": "ETH", "balance": 2, "balance_usd": 6000},
+        ])
+
+        balances = {b.token_symbol: b for b in WalletBalance.objects.filter(wallet=wallet)}
+        assert set(balances) == {"USDC", "ETH"}
+        assert balances["USDC"].balance == 5
+        assert not balances["USDC"].is_stale
@@ -1,22 +1,64 @@
 """ASGI config for CPPay project - mounts Django under FastAPI."""
 import os
-from django.core.wsgi import get_wsgi_application
+
+import django
 from fastapi import FastAPI
 from fastapi.middleware.wsgi import WSGIMiddleware
+from fastapi.staticfiles import StaticFiles
 
 # Set Django settings
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
 
-# Get Django WSGI application for mounting
-django_wsgi_app = get_wsgi_application()
 
-# Import FastAPI app (after Django setup)
-from api.main import app as fastapi_app
+def _unstripped(app, prefix: str):
+    """
+    Wrap an ASGI app so a Mount at prefix passes it the full request path
+
+    Django's URLconf includes the prefix ('admin/'), so it must see
+    /admin/... as PATH_INFO rather than as SCRIPT_NAME.
+    """
+    async def asgi(scope, receive, send):
+        root_path = scope.get('root_path', '')
+        if root_path.endswith(prefix):
+            scope = {**scope, 'root_path': root_path[:-len(prefix)]}
+        await app(scope, receive, send)
+
+    return asgi
+
+
+def build_app() -> FastAPI:
+    """
+    Set up Django and return the FastAPI app with Django mounted under it
+
+    Runs once per process. Under a preloading server it runs in the parent,
+    so workers inherit the loaded apps, URLconf and middleware chain.
+    """
+    # Set up explicitly so app registry errors surface before the mount
+    django.setup(set_prefix=False)
+
+    from django.conf import settings
+    from django.core.wsgi import get_wsgi_application
+    from api.main import app as fastapi_app
+
+    # Only the Django pages are handed to the WSGI bridge; every other path
+    # stays on the async FastAPI router, which 404s unknown routes itself
+    django_app = WSGIMiddleware(get_wsgi_application())
+    django_prefixes = []
+    if 'django.contrib.admin' in settings.INSTALLED_APPS:
+        django_prefixes.append('/admin')
+    if settings.DEBUG:
+        # Development static/media views and the debug toolbar (see urls.py)
+        django_prefixes += [settings.STATIC_URL.rstrip('/'), settings.MEDIA_URL.rstrip('/')]
+        if 'debug_toolbar' in settings.INSTALLED_APPS:
+            django_prefixes.append('/__debug__')
+    elif os.path.isdir(settings.STATIC_ROOT):
+        # Collected admin assets are served without a trip through Django
+        fastapi_app.mount(settings.STATIC_URL.rstrip('/'), StaticFiles(directory=settings.STATIC_ROOT))
+
+    for prefix in django_prefixes:
+        fastapi_app.mount(prefix, _unstripped(django_app, prefix))
+    return fastapi_app
 
-# Mount Django under FastAPI
-# This allows FastAPI to handle all requests first, 
-# then fall back to Django for admin and other Django views
-fastapi_app.mount("/", WSGIMiddleware(django_wsgi_app))
 
 # Export as application
-application = fastapi_app
+application = build_app()
@@ -3,6 +3,7 @@ Celery configuration for CPPay project.
 """
 import os
 from celery import Celery
+from celery.schedules import crontab
 from decouple import config
 
 # Set default Django settings module
@@ -16,7 +17,27 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Auto-discover tasks from all registered Django apps
 app.autodiscover_tasks()
 
-# Celery Beat Schedule for periodic tasks
+# Queues: "realtime" for short tasks on a tight cadence (run by a dedicated
+# worker with prefetch 1), "batch" for daily/weekly sweeps, and the default
+# "celery" queue for everything else. Workers must consume all three.
+REALTIME_QUEUE = 'realtime'
+BATCH_QUEUE = 'batch'
+
+app.conf.task_routes = {
+    'payments.update_token_prices': {'queue': REALTIME_QUEUE},
+    'payments.monitor_pending_payments': {'queue': REALTIME_QUEUE},
+    'monitor_pending_transactions': {'queue': REALTIME_QUEUE},
+    'update_portfolio_values': {'queue': BATCH_QUEUE},
+    'payments.reconcile_daily_payments': {'queue': BATCH_QUEUE},
+    'payments.cleanup_old_payment_cache': {'queue': BATCH_QUEUE},
+    'apps.users.tasks.cleanup_expired_tokens': {'queue': BATCH_QUEUE},
+    'apps.notifications.tasks.cleanup_old_notifications': {'queue': BATCH_QUEUE},
+    'kyc.check_expired_kyc': {'queue': BATCH_QUEUE},
+    'kyc.cleanup_old_rejections': {'queue': BATCH_QUEUE},
+}
+
+# Celery Beat Schedule for periodic tasks. Hourly and longer jobs run on
+# crontabs at distinct minutes so they do not all fire on the same tick.
 app.conf.beat_schedule = {
     # Blockchain tasks (Phase 2)
     'monitor-pending-transactions': {
@@ -25,11 +46,11 @@ app.conf.beat_schedule = {
     },
     'reset-daily-gas-limits': {
         'task': 'reset_daily_gas_limits',
-        'schedule': 86400.0,  # Daily at midnight
+        'schedule': crontab(hour=0, minute=0),  # Daily at midnight
     },
     'monitor-paymaster-balances': {
         'task': 'monitor_paymaster_balances',
-        'schedule': 3600.0,  # Every hour
+        'schedule': crontab(minute=7),  # Every hour
     },
     'retry-stuck-transactions': {
         'task': 'retry_stuck_transactions',
@@ -37,7 +58,7 @@ app.conf.beat_schedule = {
     },
     'update-portfolio-values': {
         'task': 'update_portfolio_values',
-        'schedule': 3600.0,  # Every hour
+        'schedule': crontab(minute=23),  # Every hour
     },
     
     # Payment tasks (Phase 3)
@@ -55,21 +76,31 @@ app.conf.beat_schedule = {
     },
     'retry-failed-payments': {
         'task': 'payments.retry_failed_payments',
-        'schedule': 3600.0,  # Every hour
+        'schedule': crontab(minute=37),  # Every hour
     },
     'reconcile-daily-payments': {
         'task': 'payments.reconcile_daily_payments',
-        'schedule': 86400.0,  # Daily at midnight
+        'schedule': crontab(hour=0, minute=15),  # Daily, after midnight
     },
     'cleanup-old-payment-cache': {
         'task': 'payments.cleanup_old_payment_cache',
-        'schedule': 604800.0,  # Weekly
+        'schedule': crontab(day_of_week=0, hour=4, minute=20),  # Weekly
+    },
+    
+    # User tasks
+    'flush-last-login': {
+        'task': 'apps.users.tasks.flush_last_login',
+        'schedule': 60.0,  # Every minute
+    },
+    'cleanup-expired-tokens': {
+        'task': 'apps.users.tasks.cleanup_expired_tokens',
+        'schedule': crontab(hour=3, minute=10),  # Daily
     },
     
     # Notification tasks
     'cleanup-old-notifications': {
         'task': 'apps.notifications.tasks.cleanup_old_notifications',
-        'schedule': 86400.0,  # Daily
+        'schedule': crontab(hour=3, minute=40),  # Daily
     },
     
     # KYC tasks (Phase 4)
@@ -79,23 +110,23 @@ app.conf.beat_schedule = {
     },
     'check-expired-kyc': {
         'task': 'kyc.check_expired_kyc',
-        'schedule': 86400.0,  # Daily
+        'schedule': crontab(hour=1, minute=5),  # Daily
     },
     'send-expiry-reminders': {
         'task': 'kyc.send_expiry_reminders',
-        'schedule': 86400.0,  # Daily
+        'schedule': crontab(hour=9, minute=0),  # Daily
     },
     'collect-kyc-stats': {
         'task': 'kyc.collect_stats',
-        'schedule': 3600.0,  # Every hour
+        'schedule': crontab(minute=49),  # Every hour
     },
     'cleanup-old-rejections': {
         'task': 'kyc.cleanup_old_rejections',
-        'schedule': 604800.0,  # Weekly
+        'schedule': crontab(day_of_week=0, hour=4, minute=50),  # Weekly
     },
     'alert-pending-review': {
         'task': 'kyc.alert_pending_review',
-        'schedule': 7200.0,  # Every 2 hours
+        'schedule': crontab(minute=53, hour='*/2'),  # Every 2 hours
     },
 }
 
@@ -0,0 +1,18 @@
+"""
+API-only production settings for CPPay project.
+
+For processes that serve only the FastAPI app (JWT auth, no cookies):
+the admin, sessions and messages apps and their middleware are left out,
+so Django fallback requests skip session and CSRF handling. Run the admin
+and migrations with the full production settings.
+"""
+from .production import *
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in ADMIN_APPS]
+
+MIDDLEWARE = [m for m in MIDDLEWARE if m not in ADMIN_MIDDLEWARE]
+
+TEMPLATES[0]['OPTIONS']['context_processors'] = [
+    processor for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+    if processor != 'django.contrib.messages.context_processors.messages'
+]
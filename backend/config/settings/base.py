@@ -12,12 +12,16 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SECRET_KEY = config('DJANGO_SECRET_KEY', default='insecure-key-for-development')
 
 # Application definition
-DJANGO_APPS = [
+# Only the admin needs these; API-only processes leave them out (see api_only)
+ADMIN_APPS = [
     'django.contrib.admin',
-    'django.contrib.auth',
-    'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+]
+
+DJANGO_APPS = ADMIN_APPS + [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
     'django.contrib.staticfiles',
 ]
 
@@ -42,6 +46,14 @@ LOCAL_APPS = [
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
+# Session, CSRF, user and message handling for the admin's cookie logins
+ADMIN_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -78,7 +90,7 @@ import dj_database_url
 DATABASES = {
     'default': dj_database_url.config(
         default=config('DATABASE_URL'),
-        conn_max_age=600,
+        conn_max_age=config('DB_CONN_MAX_AGE', default=600, cast=int),
         conn_health_checks=True,
     )
 }
@@ -99,6 +111,11 @@ if DATABASES.get('default') and 'sqlite' in DATABASES['default'].get('ENGINE', '
         # Fail-safe: leave original value if anything unexpected happens
         pass
 
+# PREPARE the hot login queries on first use per PostgreSQL connection. Failed
+# statements fall back to the ORM; disable behind a transaction-pooling
+# pgbouncer, which does not keep session state
+AUTH_PREPARED_STATEMENTS = config('AUTH_PREPARED_STATEMENTS', default=True, cast=bool)
+
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
@@ -121,6 +138,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Argon2id first; PBKDF2 hashes still verify and are upgraded on next login
+PASSWORD_HASHERS = [
+    'core.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+]
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -171,30 +194,33 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 
 # Cache Configuration
-# Use in-memory cache for development (no Redis required)
-# To enable Redis cache, uncomment below and comment out the in-memory cache
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-    }
-}
+# Set REDIS_CACHE_URL (ideally a dedicated Redis DB) to share the cache across
+# workers; otherwise fall back to a per-process in-memory cache
+REDIS_CACHE_URL = config('REDIS_CACHE_URL', default='')
 
-# Redis Cache (Disabled - uncomment to enable)
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': config('REDIS_URL', default='redis://localhost:6379/0'),
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#         },
-#         'KEY_PREFIX': 'cppay',
-#         'TIMEOUT': 300,  # 5 minutes default
-#     }
-# }
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+            'KEY_PREFIX': 'cppay',
+            'TIMEOUT': 300,  # 5 minutes default
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
+    }
 
 # Session Configuration
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'  # Use database sessions instead of cache
+# Sessions (admin only) are read through the cache and written to the database
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 SESSION_CACHE_ALIAS = 'default'
 
 # Logging Configuration
@@ -210,6 +236,9 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'json': {
+            '()': 'core.log.JsonFormatter',
+        },
     },
     'filters': {
         'require_debug_false': {
@@ -222,13 +251,14 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        # Written from a background thread as JSON lines
         'file': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            'class': 'core.log.QueuedRotatingFileHandler',
             'filename': BASE_DIR / 'logs' / 'cppay.log',
             'maxBytes': 1024 * 1024 * 10,  # 10MB
             'backupCount': 10,
-            'formatter': 'verbose',
+            'formatter': 'json',
         },
     },
     'root': {
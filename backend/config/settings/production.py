@@ -44,8 +44,7 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@cppay.app')
 
-# Database Connection Pooling
-DATABASES['default']['CONN_MAX_AGE'] = 600
+# Database connections persist for DB_CONN_MAX_AGE (see base settings)
 DATABASES['default']['OPTIONS'] = {
     'connect_timeout': 10,
 }
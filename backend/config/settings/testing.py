@@ -2,16 +2,25 @@
 Testing settings for CPPay project.
 """
 from .base import *
+import dj_database_url
 
 DEBUG = True
 
-# Use in-memory database for faster tests
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
+# Use in-memory database for faster tests. Set TEST_DATABASE_URL to a
+# PostgreSQL server to also cover the PostgreSQL-only paths (partial unique
+# and BRIN indexes, prepared statements, the token redeem CTE)
+TEST_DATABASE_URL = config('TEST_DATABASE_URL', default='')
+if TEST_DATABASE_URL:
+    DATABASES = {
+        'default': dj_database_url.parse(TEST_DATABASE_URL),
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
     }
-}
 
 # Use dummy cache for testing
 CACHES = {
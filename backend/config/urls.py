@@ -7,10 +7,18 @@ from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/v1/', include('api.urls')),
 ]
 
+# The admin is not installed in API-only processes (settings.api_only)
+if 'django.contrib.admin' in settings.INSTALLED_APPS:
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
+
+    # Admin site customization
+    admin.site.site_header = 'CPPay Administration'
+    admin.site.site_title = 'CPPay Admin'
+    admin.site.index_title = 'Welcome to CPPay Administration'
+
 # Serve static and media files in development
 if settings.DEBUG:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -22,8 +30,3 @@ if settings.DEBUG:
         urlpatterns = [
             path('__debug__/', include(debug_toolbar.urls)),
         ] + urlpatterns
-
-# Admin site customization
-admin.site.site_header = 'CPPay Administration'
-admin.site.site_title = 'CPPay Admin'
-admin.site.index_title = 'Welcome to CPPay Administration'
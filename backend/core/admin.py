@@ -0,0 +1,54 @@
+"""
+Shared Django admin helpers
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the changelist COUNT(*) for a short window
+
+    Every changelist page load re-counts the filtered queryset. On large
+    append-only tables the count is the slowest query on the page and
+    barely changes between reloads, so it is cached per SQL statement.
+    Counts may lag new rows by up to COUNT_CACHE_TIMEOUT seconds.
+    """
+
+    COUNT_CACHE_TIMEOUT = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return super().count
+
+        digest = hashlib.sha256(str(query).encode()).hexdigest()[:32]
+        cache_key = f"admin:count:{query.model._meta.label_lower}:{digest}"
+        count = cache.get(cache_key)
+        if count is None:
+            count = super().count
+            cache.set(cache_key, count, timeout=self.COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class ChangelistFieldsMixin:
+    """
+    ModelAdmin mixin that loads only changelist_fields on the changelist
+
+    List pages render a handful of columns, so the remaining columns (and
+    those of select_related rows) are deferred there. The change form
+    still loads every field.
+    """
+
+    changelist_fields = None
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        changelist_url = f'{self.opts.app_label}_{self.opts.model_name}_changelist'
+        if self.changelist_fields and request.resolver_match and request.resolver_match.url_name == changelist_url:
+            queryset = queryset.only(*self.changelist_fields)
+        return queryset
@@ -0,0 +1,110 @@
+"""
+Shared model fields
+"""
+import re
+
+from django.core import validators
+from django.core.exceptions import EmptyResultSet
+from django.db import models
+from django.db.models import lookups
+
+
+class HexBytesField(models.BinaryField):
+    """
+    0x-prefixed hex string in Python, raw bytes in the database
+
+    EVM addresses (20 bytes) and hashes (32 bytes) stored as bytes take
+    less than half the room of their hex text, in the table and in every
+    index on them. Lookups accept hex in any case, and a malformed value
+    matches nothing; values read back are lowercase. A blank value is
+    stored as empty bytes and read back as ''.
+    """
+
+    empty_values = list(validators.EMPTY_VALUES)
+
+    def __init__(self, *args, byte_length=None, **kwargs):
+        self.byte_length = byte_length
+        kwargs.setdefault('editable', True)
+        super().__init__(*args, **kwargs)
+        count = f'{{{byte_length}}}' if byte_length else '*'
+        self.validators.append(validators.RegexValidator(
+            re.compile(rf'^0x(?:[0-9a-fA-F]{{2}}){count}$'),
+            message='Enter a 0x-prefixed hex value of the expected length.',
+        ))
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.byte_length is not None:
+            kwargs['byte_length'] = self.byte_length
+        return name, path, args, kwargs
+
+    def get_default(self):
+        default = super().get_default()
+        return '' if default == b'' else default
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return '0x' + bytes(value).hex() if value else ''
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return '0x' + bytes(value).hex() if value else ''
+        return value
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if value is None or isinstance(value, (bytes, memoryview)):
+            return value
+        if not value:
+            return b''
+        if not value.startswith(('0x', '0X')):
+            raise ValueError(f"{value!r} is not a 0x-prefixed hex value")
+        return bytes.fromhex(value[2:])
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj) or ''
+
+    def formfield(self, **kwargs):
+        # Edited as hex text; skip BinaryField's form handling
+        if self.byte_length:
+            kwargs.setdefault('max_length', 2 + 2 * self.byte_length)
+        if self.null:
+            kwargs.setdefault('empty_value', None)
+        return models.Field.formfield(self, **kwargs)
+
+
+@HexBytesField.register_lookup
+class HexBytesExact(lookups.Exact):
+    """Exact match where a value that is not 0x-hex matches no rows"""
+
+    def get_prep_lookup(self):
+        self.malformed = False
+        try:
+            return super().get_prep_lookup()
+        except ValueError:
+            self.malformed = True
+            return self.rhs
+
+    def as_sql(self, compiler, connection):
+        if self.malformed:
+            raise EmptyResultSet
+        return super().as_sql(compiler, connection)
+
+
+@HexBytesField.register_lookup
+class HexBytesIn(lookups.In):
+    """IN lookup that skips values that are not 0x-hex"""
+
+    def get_prep_lookup(self):
+        if self.rhs_is_direct_value():
+            field = self.lhs.output_field
+            valid = []
+            for value in self.rhs:
+                try:
+                    field.get_prep_value(value)
+                except ValueError:
+                    continue
+                valid.append(value)
+            self.rhs = valid
+        return super().get_prep_lookup()
@@ -0,0 +1,17 @@
+"""
+Password hashers
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with a 64 MiB / 2-lane cost profile
+
+    Keeps the ``argon2`` algorithm name, so hashes made with Django's
+    default parameters still verify and are re-hashed on next login.
+    """
+
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 2
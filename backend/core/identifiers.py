@@ -0,0 +1,28 @@
+"""
+Identifier helpers shared across models
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7)
+
+    The first 48 bits hold the Unix timestamp in milliseconds, so values
+    sort by creation time and new rows land on the rightmost page of the
+    primary-key B-tree instead of a random one.
+
+    Returns:
+        UUID with version 7 and RFC 4122 variant bits set
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                            # version
+    value |= ((rand >> 62) & 0xFFF) << 64         # rand_a (12 bits)
+    value |= 0b10 << 62                           # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF         # rand_b (62 bits)
+    return uuid.UUID(int=value)
@@ -0,0 +1,82 @@
+"""
+Logging handlers and formatters
+"""
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import datetime, timezone
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, for log shippers to ingest without re-parsing
+    """
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'process': record.process,
+            'thread': record.thread,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class QueuedRotatingFileHandler(logging.handlers.QueueHandler):
+    """
+    RotatingFileHandler that writes from a background thread
+
+    Logging calls only put the record on an in-process queue; a
+    QueueListener formats it and does the locked file write. The listener
+    is restarted after fork, so preloaded Gunicorn and Celery prefork
+    children keep logging.
+
+    Accepts the same arguments as RotatingFileHandler.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None):
+        self.target = logging.handlers.RotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding,
+        )
+        super().__init__(queue.SimpleQueue())
+        self._start_listener()
+        os.register_at_fork(after_in_child=self._restart_after_fork)
+
+    def _start_listener(self):
+        self.listener = logging.handlers.QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def _restart_after_fork(self):
+        # The listener thread does not survive fork; records still queued
+        # belong to the parent, which writes them itself
+        if self.listener is None:
+            return
+        self.queue = queue.SimpleQueue()
+        self._start_listener()
+
+    def setFormatter(self, fmt):
+        # Formatting happens in the listener thread, on the file handler
+        self.target.setFormatter(fmt)
+
+    def prepare(self, record):
+        # Same-process queue: resolve the message text only, and leave
+        # formatting (including tracebacks) to the listener
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self):
+        # Called by both dictConfig reconfiguration and logging.shutdown
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.target.close()
+        super().close()
@@ -6,10 +6,11 @@ from typing import Optional
 import secrets
 
 from passlib.context import CryptContext
-from jose import JWTError, jwt
+from django.contrib.auth.hashers import check_password, make_password
+import jwt
 from django.conf import settings
 
-# Password hashing context with bcrypt
+# Legacy bcrypt context; only verifies hashes stored before the Django hashers
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
 # JWT settings
@@ -18,10 +19,13 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Characters that satisfy the password special-character rule
+SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt with cost factor 12
+    Hash a password with the first of settings.PASSWORD_HASHERS (Argon2id)
     
     Args:
         password: Plain text password
@@ -29,7 +33,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return make_password(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -43,7 +47,10 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # Bare bcrypt hashes predate the Django hashers and carry no algorithm prefix
+    if hashed_password.startswith('$2'):
+        return pwd_context.verify(plain_password, hashed_password)
+    return check_password(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -66,7 +73,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     to_encode.update({
         "exp": expire,
-        "type": "access"
+        "type": "access",
+        "jti": secrets.token_hex(16),
     })
     
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -88,7 +96,8 @@ def create_refresh_token(data: dict) -> str:
     
     to_encode.update({
         "exp": expire,
-        "type": "refresh"
+        "type": "refresh",
+        "jti": secrets.token_hex(16),
     })
     
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -108,7 +117,7 @@ def decode_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -142,17 +151,28 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not any(c.isupper() for c in password):
+    # Classify every character in one pass instead of one scan per rule
+    has_upper = has_lower = has_digit = has_special = False
+    for c in set(password):
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        elif c in SPECIAL_CHARS:
+            has_special = True
+    
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
     
-    if not any(c.islower() for c in password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
     
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         return False, "Password must contain at least one digit"
     
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(c in special_chars for c in password):
+    if not has_special:
         return False, "Password must contain at least one special character"
     
     return True, ""
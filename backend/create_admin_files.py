@@ -98,7 +98,7 @@ from .models import GasSponsorship, GasSponsorshipHistory
 
 @admin.register(GasSponsorship)
 class GasSponsorshipAdmin(admin.ModelAdmin):
-    list_display = ['user', 'chain_id', 'daily_limit', 'used_today', 'kyc_multiplier', 'is_active', 'last_reset_date']
+    list_display = ['user', 'chain_id', 'daily_limit', 'used_today', 'kyc_multiplier_bps', 'is_active', 'last_reset_date']
     list_filter = ['chain_id', 'is_active', 'is_verified', 'last_reset_date']
     search_fields = ['user__email']
     readonly_fields = ['id', 'created_at', 'updated_at', 'total_gas_sponsored', 'transactions_sponsored']
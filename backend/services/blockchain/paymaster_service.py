@@ -278,8 +278,7 @@ class PaymasterService:
                 return
             
             gas_record, created = GasSponsorship.objects.get_or_create(
-                user=wallet.user,
-                wallet=wallet,
+                user_id=wallet.user_id,
                 chain_id=self.chain_id,
                 defaults={
                     'daily_limit': self.w3.to_wei(1, 'ether'),  # 1 ETH default
@@ -288,16 +287,9 @@ class PaymasterService:
                 }
             )
             
-            # Reset if new day
-            if gas_record.last_reset_date < timezone.now().date():
-                gas_record.used_today = 0
-                gas_record.last_reset_date = timezone.now().date()
-            
-            # Update usage
-            gas_record.used_today += gas_used
-            gas_record.total_gas_sponsored += gas_used
-            gas_record.transaction_count += 1
-            gas_record.save()
+            # Running counters on the sponsorship row back the statistics
+            # endpoint, so it never has to aggregate GasSponsorshipHistory
+            gas_record.record_usage(gas_used)
             
             logger.info(f"✅ Updated gas usage for {user_address}: +{self.w3.from_wei(gas_used, 'ether')} ETH")
             
@@ -432,7 +424,6 @@ class PaymasterService:
         """
         try:
             from apps.wallets.models import Wallet
-            from django.db.models import Sum
             
             wallet = Wallet.objects.filter(
                 smart_account_address=user_address,
@@ -447,11 +438,11 @@ class PaymasterService:
                     'monthly_sponsored': 0
                 }
             
+            # Single row read of the pre-aggregated counters
             gas_record = GasSponsorship.objects.filter(
-                user=wallet.user,
-                wallet=wallet,
+                user_id=wallet.user_id,
                 chain_id=self.chain_id
-            ).first()
+            ).values('total_gas_sponsored', 'transactions_sponsored', 'used_today', 'updated_at').first()
             
             if not gas_record:
                 return {
@@ -462,22 +453,14 @@ class PaymasterService:
                 }
             
             # Calculate statistics
-            total_sponsored = gas_record.total_gas_sponsored
-            tx_count = gas_record.transaction_count
+            total_sponsored = gas_record['total_gas_sponsored']
+            tx_count = gas_record['transactions_sponsored']
             avg_per_tx = total_sponsored / tx_count if tx_count > 0 else 0
             
-            # Get monthly total
-            from datetime import datetime
-            from django.utils import timezone
-            
+            # (user, chain_id) is unique, so the monthly figure is this row's
+            # usage if it was touched this month
             start_of_month = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            monthly_records = GasSponsorship.objects.filter(
-                user=wallet.user,
-                chain_id=self.chain_id,
-                updated_at__gte=start_of_month
-            ).aggregate(total=Sum('used_today'))
-            
-            monthly_sponsored = monthly_records.get('total', 0) or 0
+            monthly_sponsored = gas_record['used_today'] if gas_record['updated_at'] >= start_of_month else 0
             
             return {
                 'total_sponsored': total_sponsored,
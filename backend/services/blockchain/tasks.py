@@ -107,18 +107,15 @@ def reset_daily_gas_limits():
         
         today = timezone.now().date()
         
-        # Find all gas sponsorship records that need reset
-        records_to_reset = GasSponsorship.objects.filter(
+        # Reset used_today and update last_reset_date in one statement;
+        # update() returns the affected row count
+        count = GasSponsorship.objects.filter(
             last_reset_date__lt=today,
             used_today__gt=0
-        )
-        
-        count = records_to_reset.count()
-        
-        # Reset used_today and update last_reset_date
-        records_to_reset.update(
+        ).update(
             used_today=0,
-            last_reset_date=today
+            last_reset_date=today,
+            updated_at=timezone.now()
         )
         
         logger.info(f"✅ Reset gas limits for {count} users")
@@ -346,16 +343,15 @@ def _send_admin_alert(title: str, data: dict):
         from apps.users.models import User
         
         # Get all admin users
-        admins = User.objects.filter(is_staff=True, is_active=True)
+        admin_ids = User.objects.filter(is_staff=True, is_active=True).values_list('id', flat=True)
         
-        for admin in admins:
-            Notification.objects.create(
-                user=admin,
-                title=title,
-                message=str(data),
-                notification_type='system',
-                metadata=data
-            )
+        Notification.bulk_send(
+            admin_ids,
+            title=title,
+            message=str(data),
+            notification_type='system',
+            metadata=data
+        )
             
     except Exception as e:
         logger.error(f"❌ Error sending admin alert: {str(e)}")
@@ -14,6 +14,9 @@ from apps.bundler.models import BundlerJob, UserOperation, UserOperationEvent
 
 logger = logging.getLogger(__name__)
 
+# Audit events emitted by a batch transition are written with one INSERT per chunk
+EVENT_BATCH_SIZE = 500
+
 
 @dataclass(slots=True)
 class QueuedOperation:
@@ -40,6 +43,8 @@ class BundlerGatewayService:
         """Persist a queued user operation alongside its first job."""
         payload = payload or {}
         metadata = metadata or {}
+        # One clock read stamps both the operation and its first job
+        now = timezone.now()
 
         with transaction.atomic():
             user_operation, _ = UserOperation.objects.select_for_update().get_or_create(
@@ -55,6 +60,8 @@ class BundlerGatewayService:
                     'max_fee_per_gas': int(payload.get('max_fee_per_gas', 0) or 0),
                     'max_priority_fee_per_gas': int(payload.get('max_priority_fee_per_gas', 0) or 0),
                     'metadata': metadata,
+                    'source': str(metadata.get('source', ''))[:32],
+                    'queued_at': now,
                 },
             )
 
@@ -67,6 +74,7 @@ class BundlerGatewayService:
             job = BundlerJob.objects.create(
                 user_operation=user_operation,
                 target_endpoint=endpoint,
+                enqueued_at=now,
                 metadata={'attempt_context': 'initial'},
             )
 
@@ -82,6 +90,7 @@ class BundlerGatewayService:
     def dispatch_batch(self, *, batch_size: int = 10) -> dict:
         """Claim the next batch of jobs and mark them for dispatch."""
         claimed: list[BundlerJob] = []
+        events: list[UserOperationEvent] = []
         now = timezone.now()
 
         with transaction.atomic():
@@ -103,11 +112,13 @@ class BundlerGatewayService:
                 job.user_operation.status = UserOperation.Status.DISPATCHED
                 job.user_operation.save(update_fields=['status', 'updated_at'])
 
-                UserOperationEvent.objects.create(
+                events.append(UserOperationEvent(
                     user_operation=job.user_operation,
                     event_type='dispatching',
                     payload={'job_id': str(job.id), 'endpoint': job.target_endpoint},
-                )
+                ))
+
+            UserOperationEvent.objects.bulk_create(events, batch_size=EVENT_BATCH_SIZE)
 
         if not claimed:
             return {'count': 0, 'job_ids': []}
@@ -133,6 +144,7 @@ class BundlerGatewayService:
 
         requeued = 0
         failed = 0
+        events: list[UserOperationEvent] = []
 
         with transaction.atomic():
             for job in inflight:
@@ -141,11 +153,11 @@ class BundlerGatewayService:
                     job.last_error = job.last_error or 'Dispatch attempts exceeded'
                     job.save(update_fields=['status', 'last_error', 'updated_at'])
                     job.user_operation.mark_status(UserOperation.Status.FAILED, reason=job.last_error)
-                    UserOperationEvent.objects.create(
+                    events.append(UserOperationEvent(
                         user_operation=job.user_operation,
                         event_type='failed',
                         payload={'job_id': str(job.id), 'reason': job.last_error},
-                    )
+                    ))
                     failed += 1
                     continue
 
@@ -153,13 +165,15 @@ class BundlerGatewayService:
                 job.save(update_fields=['status', 'updated_at'])
                 job.user_operation.status = UserOperation.Status.QUEUED
                 job.user_operation.save(update_fields=['status', 'updated_at'])
-                UserOperationEvent.objects.create(
+                events.append(UserOperationEvent(
                     user_operation=job.user_operation,
                     event_type='requeued',
                     payload={'job_id': str(job.id)},
-                )
+                ))
                 requeued += 1
 
+            UserOperationEvent.objects.bulk_create(events, batch_size=EVENT_BATCH_SIZE)
+
         logger.warning(
             "♻️ Reconciled %s inflight jobs (requeued=%s failed=%s)",
             len(inflight),
@@ -179,12 +193,9 @@ class BundlerGatewayService:
             user_operation = job.user_operation
             operation_hash = user_operation.user_op_hash
             user_operation.status = UserOperation.Status.INCLUDED
-            user_operation.metadata = {
-                **user_operation.metadata,
-                'tx_hash': tx_hash,
-            }
+            user_operation.tx_hash = tx_hash
             user_operation.completed_at = timezone.now()
-            user_operation.save(update_fields=['status', 'metadata', 'completed_at', 'updated_at'])
+            user_operation.save(update_fields=['status', 'tx_hash', 'completed_at', 'updated_at'])
 
             UserOperationEvent.objects.create(
                 user_operation=user_operation,
@@ -14,7 +14,7 @@ from datetime import datetime
 
 from .dex_aggregation_service import DEXAggregationService
 from .price_oracle_service import PriceOracleService
-from .paystack_service import PaystackService
+from .paystack_service import get_paystack_service
 from apps.transactions.models import Transaction
 from apps.payments.models import Payment
 
@@ -49,7 +49,7 @@ class CryptoToFiatBridge:
         """Initialize crypto-to-fiat bridge"""
         self.dex = DEXAggregationService()
         self.oracle = PriceOracleService()
-        self.paystack = PaystackService()
+        self.paystack = get_paystack_service()
         
     async def calculate_crypto_needed(
         self,
@@ -4,8 +4,14 @@ Flutterwave OAuth 2.0 Token Management Service
 Handles automatic token generation, caching, and refresh for Flutterwave API.
 Implements OAuth 2.0 client credentials flow for sandbox/production environments.
 """
+import atexit
+import hashlib
+import importlib.util
 import logging
+import threading
 import httpx
+import orjson
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from decouple import config
@@ -30,10 +36,8 @@ class FlutterwaveOAuthService:
     # OAuth2 token endpoint
     TOKEN_ENDPOINT = "https://idp.flutterwave.com/realms/flutterwave/protocol/openid-connect/token"
     
-    # Cache keys
-    CACHE_KEY_ACCESS_TOKEN = "flutterwave:oauth:access_token"
-    CACHE_KEY_TOKEN_EXPIRY = "flutterwave:oauth:token_expiry"
-    CACHE_KEY_TOKEN_METADATA = "flutterwave:oauth:token_metadata"
+    # Cache key prefix; token, expiry and metadata share one entry per client
+    CACHE_KEY_PREFIX = "fw:oauth"
     
     # Token refresh buffer (refresh 60 seconds before actual expiry)
     REFRESH_BUFFER_SECONDS = 60
@@ -41,6 +45,9 @@ class FlutterwaveOAuthService:
     # Request timeout
     REQUEST_TIMEOUT = 30.0
     
+    # Idle connections are kept just under Flutterwave's 90s keep-alive window
+    KEEPALIVE_EXPIRY = 85.0
+    
     def __init__(self):
         """Initialize OAuth service with credentials from environment"""
         # Use decouple to read from .env with proper fallbacks
@@ -56,6 +63,32 @@ class FlutterwaveOAuthService:
             )
         else:
             logger.info(f"Flutterwave OAuth Service initialized ({self.environment})")
+        
+        client_digest = hashlib.sha256((self.client_id or '').encode()).hexdigest()[:16]
+        self.cache_key = f"{self.CACHE_KEY_PREFIX}:{client_digest}"
+        self._client: Optional[httpx.Client] = None
+        # Serialises refreshes so concurrent callers share one token request
+        self._refresh_lock = threading.RLock()
+    
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Pooled HTTP client shared by token requests and Flutterwave API calls.
+        
+        Negotiates HTTP/2 when the h2 package is installed and falls back
+        to keep-alive HTTP/1.1 otherwise.
+        """
+        if self._client is None:
+            self._client = httpx.Client(
+                http2=importlib.util.find_spec('h2') is not None,
+                timeout=self.REQUEST_TIMEOUT,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+            )
+            atexit.register(self._client.close)
+        return self._client
     
     def get_access_token(self, force_refresh: bool = False) -> Optional[str]:
         """
@@ -74,13 +107,22 @@ class FlutterwaveOAuthService:
                 logger.debug("Using cached Flutterwave access token")
                 return cached_token
         
-        # Generate new token
-        logger.info(f"Generating new Flutterwave access token ({self.environment})")
-        token_data = self._request_new_token()
-        
-        if token_data:
-            self._cache_token(token_data)
-            return token_data.get('access_token')
+        with self._refresh_lock:
+            if force_refresh:
+                cache.delete(self.cache_key)
+            else:
+                # Another thread may have refreshed while we waited
+                cached_token = self._get_cached_token()
+                if cached_token:
+                    return cached_token
+            
+            # Generate new token
+            logger.info(f"Generating new Flutterwave access token ({self.environment})")
+            token_data = self._request_new_token()
+            
+            if token_data:
+                self._cache_token(token_data)
+                return token_data.get('access_token')
         
         logger.error("Failed to generate Flutterwave access token")
         return None
@@ -93,8 +135,9 @@ class FlutterwaveOAuthService:
             str: Cached access token or None if expired/missing
         """
         try:
-            token = cache.get(self.CACHE_KEY_ACCESS_TOKEN)
-            expiry = cache.get(self.CACHE_KEY_TOKEN_EXPIRY)
+            entry = cache.get(self.cache_key) or {}
+            token = entry.get('token')
+            expiry = entry.get('expiry')
             
             if token and expiry:
                 # Check if token is still valid (with buffer)
@@ -108,8 +151,7 @@ class FlutterwaveOAuthService:
                 else:
                     logger.debug("Cached Flutterwave token expired, will refresh")
                     # Clear expired cache
-                    cache.delete(self.CACHE_KEY_ACCESS_TOKEN)
-                    cache.delete(self.CACHE_KEY_TOKEN_EXPIRY)
+                    cache.delete(self.cache_key)
             
             return None
         except Exception as e:
@@ -140,15 +182,14 @@ class FlutterwaveOAuthService:
             
             logger.debug(f"Requesting token from {self.TOKEN_ENDPOINT}")
             
-            response = httpx.post(
+            response = self.client.post(
                 self.TOKEN_ENDPOINT,
                 data=payload,
                 headers=headers,
-                timeout=self.REQUEST_TIMEOUT
             )
             
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             
             # Validate response
             if 'access_token' not in token_data:
@@ -189,21 +230,7 @@ class FlutterwaveOAuthService:
             expiry_seconds = max(expires_in - self.REFRESH_BUFFER_SECONDS, 60)
             expiry_datetime = datetime.utcnow() + timedelta(seconds=expiry_seconds)
             
-            # Cache token
-            cache.set(
-                self.CACHE_KEY_ACCESS_TOKEN,
-                access_token,
-                timeout=expiry_seconds
-            )
-            
-            # Cache expiry timestamp for comparison
-            cache.set(
-                self.CACHE_KEY_TOKEN_EXPIRY,
-                expiry_datetime,
-                timeout=expiry_seconds
-            )
-            
-            # Cache full metadata for debugging
+            # Token, expiry and metadata share one entry so a lookup is a single GET
             metadata = {
                 'cached_at': datetime.utcnow().isoformat(),
                 'expires_at': expiry_datetime.isoformat(),
@@ -212,8 +239,8 @@ class FlutterwaveOAuthService:
                 'scope': token_data.get('scope', ''),
             }
             cache.set(
-                self.CACHE_KEY_TOKEN_METADATA,
-                metadata,
+                self.cache_key,
+                {'token': access_token, 'expiry': expiry_datetime, 'metadata': metadata},
                 timeout=expiry_seconds
             )
             
@@ -232,13 +259,12 @@ class FlutterwaveOAuthService:
         Returns:
             Dict with token metadata or None
         """
-        return cache.get(self.CACHE_KEY_TOKEN_METADATA)
+        entry = cache.get(self.cache_key)
+        return entry.get('metadata') if entry else None
     
     def clear_cache(self) -> None:
         """Clear all cached token data"""
-        cache.delete(self.CACHE_KEY_ACCESS_TOKEN)
-        cache.delete(self.CACHE_KEY_TOKEN_EXPIRY)
-        cache.delete(self.CACHE_KEY_TOKEN_METADATA)
+        cache.delete(self.cache_key)
         logger.info("Cleared Flutterwave OAuth token cache")
     
     def validate_credentials(self) -> bool:
@@ -265,16 +291,10 @@ class FlutterwaveOAuthService:
             return False
 
 
-# Singleton instance
-_oauth_service = None
-
-
+@lru_cache(maxsize=1)
 def get_oauth_service() -> FlutterwaveOAuthService:
-    """Get or create singleton OAuth service instance"""
-    global _oauth_service
-    if _oauth_service is None:
-        _oauth_service = FlutterwaveOAuthService()
-    return _oauth_service
+    """Process-wide OAuth service; ``get_oauth_service.cache_clear()`` reloads config."""
+    return FlutterwaveOAuthService()
 
 
 async def get_flutterwave_access_token(force_refresh: bool = False) -> Optional[str]:
@@ -18,6 +18,7 @@ import hashlib
 import hmac
 import logging
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import httpx
@@ -473,11 +474,7 @@ class PaystackService:
         return await self._request('GET', f'/transaction/verify/{reference}')
 
 
-_paystack_service: Optional[PaystackService] = None
-
-
+@lru_cache(maxsize=1)
 def get_paystack_service() -> PaystackService:
-    global _paystack_service  # pylint: disable=global-statement
-    if _paystack_service is None:
-        _paystack_service = PaystackService()
-    return _paystack_service
+    """Process-wide Paystack client; ``get_paystack_service.cache_clear()`` reloads config."""
+    return PaystackService()
@@ -17,14 +17,14 @@ from django.utils import timezone
 from apps.payments.models import Payment
 from services.payments import (
     PriceOracleService,
-    PaystackService,
-    CryptoToFiatBridge
+    CryptoToFiatBridge,
+    get_paystack_service
 )
 
 logger = logging.getLogger(__name__)
 
 price_oracle = PriceOracleService()
-paystack = PaystackService()
+paystack = get_paystack_service()
 crypto_fiat_bridge = CryptoToFiatBridge()
 
 